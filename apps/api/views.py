@@ -240,9 +240,7 @@ class StaffConsultantViewSet(viewsets.ViewSet):
     def list(self, request):  # type: ignore[override]
         queryset, filters = build_dashboard_queryset(request.query_params)
 
-        queryset = queryset.select_related("user").prefetch_related(
-            "certificate_records"
-        )
+        queryset = ConsultantDashboardSerializer.prepare_queryset(queryset)
 
         page = _parse_int(request.query_params.get("page"), 1)
         page_size = min(
@@ -293,7 +291,7 @@ class StaffLogEntryViewSet(viewsets.ViewSet):
     throttle_classes = [RoleBasedRateThrottle]
 
     def list(self, request):  # type: ignore[override]
-        queryset = LogEntry.objects.select_related("user").all()
+        queryset = LegacyLogEntrySerializer.prepare_queryset(LogEntry.objects.all())
 
         level = (request.query_params.get("level") or "").strip().upper()
         if level:
@@ -7,6 +7,7 @@ from io import BytesIO
 from typing import Iterable, Optional
 
 from django.contrib.auth.models import AbstractBaseUser
+from django.core.files import File
 from django.core.files.base import ContentFile
 from django.utils import timezone
 from PIL import Image, ImageDraw, ImageFont
@@ -41,15 +42,18 @@ def _render_pdf(title: str, paragraphs: Iterable[str]) -> ContentFile:
     title_x = (PAGE_WIDTH - title_width) / 2
     draw.text((title_x, TITLE_Y), title, fill="black", font=title_font)
 
+    # The body font has a fixed line height, so paragraph heights can be derived
+    # from the wrapped line count instead of measuring each block of text.
+    line_advance = draw.textbbox((0, 0), "A", font=body_font)[3] + LINE_SPACING
+
     y = TITLE_Y + 120
     for paragraph in paragraphs:
         if not paragraph:
             y += LINE_SPACING * 2
             continue
         wrapped = textwrap.fill(paragraph, width=80)
-        bbox = draw.multiline_textbbox((MARGIN_X, y), wrapped, font=body_font, spacing=LINE_SPACING)
         draw.multiline_text((MARGIN_X, y), wrapped, fill="black", font=body_font, spacing=LINE_SPACING)
-        y = bbox[3] + (LINE_SPACING * 2)
+        y += line_advance * (wrapped.count("\n") + 1) + LINE_SPACING
 
     buffer = BytesIO()
     image.save(buffer, format="PDF")
@@ -113,12 +117,15 @@ def generate_approval_certificate(
         ]
     )
 
-    for previous in consultant.certificate_records.exclude(pk=certificate_record.pk):
-        previous.mark_status(
-            Certificate.Status.REISSUED,
-            timestamp=issued_at,
-            reason=f"Superseded by certificate issued on {issued_at.date().isoformat()}",
-        )
+    # Mirrors Certificate.mark_status(REISSUED) for every earlier record in a
+    # single UPDATE instead of one save() round-trip per historical certificate.
+    consultant.certificate_records.exclude(pk=certificate_record.pk).update(
+        status=Certificate.Status.REISSUED,
+        status_set_at=issued_at,
+        reissued_at=issued_at,
+        status_reason=f"Superseded by certificate issued on {issued_at.date().isoformat()}",
+        updated_at=timezone.now(),
+    )
 
     verification_url = build_verification_url(consultant)
     signature_image = None
@@ -156,9 +163,7 @@ def generate_approval_certificate(
     )
 
     filename = f"approval-certificate-{consultant.pk}.pdf"
-    consultant.certificate_pdf.save(
-        filename, ContentFile(pdf_stream.getvalue()), save=False
-    )
+    consultant.certificate_pdf.save(filename, File(pdf_stream), save=False)
     consultant.save(
         update_fields=[
             "certificate_pdf",
@@ -4,7 +4,8 @@ import base64
 import shutil
 import tempfile
 from contextlib import ExitStack
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+from pathlib import Path
 
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -12,13 +13,13 @@ from django.template.loader import render_to_string
 from django.test import TestCase, override_settings
 from django.utils import timezone
 from django.utils.formats import date_format
-from PIL import Image
 from unittest.mock import patch
 
 from apps.certificates.services import generate_approval_certificate
 from apps.consultants.models import Consultant
 from apps.security.models import AuditLog
 from apps.users.models import BoardMemberProfile
+from consultant_app.models import Certificate
 
 
 class GenerateApprovalCertificateTests(TestCase):
@@ -88,8 +89,8 @@ class GenerateApprovalCertificateTests(TestCase):
                 target.write(b"%PDF-1.4\n" + payload + b"\n%%EOF")
             return None
 
-        def fake_qr_code(data, *, box_size=8, border=2):  # noqa: ARG001 - signature defined by patch
-            return Image.new("RGB", (20, 20), "white")
+        def fake_qr_svg(data, *, box_size=8, border=2):  # noqa: ARG001 - signature defined by patch
+            return '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1 1"></svg>'
 
         stack = ExitStack()
         stack.enter_context(patch("apps.certificates.services.timezone.now", return_value=self.fixed_now))
@@ -103,8 +104,8 @@ class GenerateApprovalCertificateTests(TestCase):
         stack.enter_context(
             patch("consultant_app.certificates.render_to_string", side_effect=capture)
         )
-        stack.enter_context(patch("consultant_app.certificates.HTML.write_pdf", new=fake_write_pdf))
-        stack.enter_context(patch("consultant_app.certificates.generate_qr_code", side_effect=fake_qr_code))
+        stack.enter_context(patch("weasyprint.HTML.write_pdf", new=fake_write_pdf))
+        stack.enter_context(patch("consultant_app.certificates.generate_qr_svg", side_effect=fake_qr_svg))
 
         return stack, captured
 
@@ -134,7 +135,10 @@ class GenerateApprovalCertificateTests(TestCase):
         self.assertEqual(context["signer_name"], self.generated_by)
         self.assertEqual(context["signing_datetime"], self.fixed_now)
         self.assertIsNotNone(context["signature_image"])
-        self.assertTrue(str(context["signature_image"]).startswith("data:image/png;base64"))
+        self.assertEqual(
+            context["signature_image"],
+            Path(profile.signature_image.path).resolve().as_uri(),
+        )
         self.assertIn(str(self.consultant.certificate_uuid), str(context["verification_url"]))
 
         with pdf_file.open("rb") as handle:
@@ -230,3 +234,37 @@ class GenerateApprovalCertificateTests(TestCase):
         self.assertNotIn("signed_at", audit_log.context)
         self.assertEqual(audit_log.context.get("signatory_user_id"), self.board_user.pk)
 
+    def test_generate_certificate_supersedes_previous_records(self):
+        earlier = [
+            Certificate.objects.create(
+                consultant=self.consultant,
+                status=status,
+                issued_at=self.fixed_now - timedelta(days=days),
+            )
+            for status, days in (
+                (Certificate.Status.VALID, 30),
+                (Certificate.Status.REVOKED, 60),
+            )
+        ]
+
+        stack, _ = self._patched_context()
+        with stack, patch("apps.certificates.services.get_board_signature", return_value=None):
+            generate_approval_certificate(
+                self.consultant,
+                generated_by=self.generated_by,
+                actor=self.board_user,
+            )
+
+        for record in earlier:
+            record.refresh_from_db()
+            self.assertEqual(record.status, Certificate.Status.REISSUED)
+            self.assertEqual(record.status_set_at, self.fixed_now)
+            self.assertEqual(record.reissued_at, self.fixed_now)
+            self.assertEqual(
+                record.status_reason,
+                f"Superseded by certificate issued on {self.fixed_now.date().isoformat()}",
+            )
+
+        current = Certificate.objects.latest_for_consultant(self.consultant)
+        self.assertEqual(current.status, Certificate.Status.VALID)
+        self.assertEqual(current.issued_at, self.fixed_now)
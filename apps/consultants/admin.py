@@ -11,6 +11,7 @@ from django.utils.translation import ngettext
 from consultant_app.models import Certificate
 from consultant_app.tasks import (
     reissue_certificate_task,
+    render_certificates_batch_task,
     revoke_certificate_task,
 )
 
@@ -20,8 +21,10 @@ from .models import Consultant, LogEntry, Notification
 class ConsultantAdminActionForm(ActionForm):
     """Expose additional inputs for consultant certificate admin actions."""
 
+    # Optional at the form level so actions that need no justification (such as
+    # regenerating PDFs) still run; the status actions validate it themselves.
     reason = forms.CharField(
-        required=True,
+        required=False,
         label="Reason for certificate status change",
         help_text="Provide a justification when revoking or reissuing a certificate.",
         widget=forms.Textarea(attrs={"rows": 2}),
@@ -44,6 +47,7 @@ class ConsultantAdmin(admin.ModelAdmin):
     actions = [
         "action_mark_certificate_revoked",
         "action_mark_certificate_reissued",
+        "action_regenerate_certificate_pdfs",
     ]
     action_form = ConsultantAdminActionForm
 
@@ -133,6 +137,26 @@ class ConsultantAdmin(admin.ModelAdmin):
             status=Certificate.Status.REISSUED,
         )
 
+    @admin.action(description="Regenerate certificate PDFs")
+    def action_regenerate_certificate_pdfs(self, request, queryset):
+        consultant_ids = list(queryset.values_list("pk", flat=True))
+        try:
+            render_certificates_batch_task.delay(consultant_ids, actor_id=request.user.pk)
+        except Exception:
+            messages.error(
+                request,
+                "Failed to queue the certificate render task. Please try again.",
+            )
+            return None
+
+        message = ngettext(
+            "Queued certificate PDF regeneration for %(count)d consultant.",
+            "Queued certificate PDF regeneration for %(count)d consultants.",
+            len(consultant_ids),
+        ) % {"count": len(consultant_ids)}
+        self.message_user(request, message, level=messages.SUCCESS)
+        return None
+
     def _execute_certificate_status_action(self, request, queryset, *, status):
         reason = (request.POST.get("reason") or "").strip()
         if not reason:
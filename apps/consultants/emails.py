@@ -7,8 +7,12 @@ def _default_from_email() -> str:
     return getattr(settings, "DEFAULT_FROM_EMAIL", None) or "no-reply@example.com"
 
 
-def send_submission_confirmation_email(consultant):
-    """Send a confirmation email to the consultant after submission."""
+def send_submission_confirmation_email(consultant, connection=None):
+    """Send a confirmation email to the consultant after submission.
+
+    Pass an open ``connection`` to reuse one SMTP session across several
+    emails.
+    """
     subject = _("Consultant Application Submitted")
     message_lines = [
         _("Hello {name},").format(name=consultant.full_name),
@@ -34,6 +38,7 @@ def send_submission_confirmation_email(consultant):
         _default_from_email(),
         [consultant.email],
         fail_silently=False,
+        connection=connection,
     )
 
 
@@ -0,0 +1,36 @@
+"""Add functional indexes for case-insensitive consultant lookups."""
+
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("consultants", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="consultant",
+            index=models.Index(
+                Lower("email"),
+                Lower("nationality"),
+                name="consultant_email_nat_lower_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="consultant",
+            index=models.Index(
+                Lower("id_number"),
+                name="consultant_id_number_lower_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="consultant",
+            index=models.Index(
+                Lower("registration_number"),
+                name="consultant_reg_no_lower_idx",
+            ),
+        ),
+    ]
@@ -4,6 +4,7 @@ from pathlib import Path
 
 from django.conf import settings
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
 
 
@@ -13,6 +14,35 @@ def document_upload_to(instance: "Document", filename: str) -> str:
     unique_name = f"{uuid.uuid4().hex}{extension}"
     return f"docs/{application_id}/{unique_name}"
 
+class ConsultantQuerySet(models.QuerySet):
+    """Custom queryset helpers for the :class:`Consultant` model."""
+
+    #: Uploaded documents that make up a complete application.
+    DOCUMENT_FIELDS = (
+        "photo",
+        "id_document",
+        "cv",
+        "police_clearance",
+        "qualifications",
+        "business_certificate",
+    )
+
+    def with_document_flags(self) -> "ConsultantQuerySet":
+        """Annotate ``_has_<field>`` flags so callers skip the file descriptors."""
+
+        return self.annotate(
+            **{
+                f"_has_{field}": models.Case(
+                    models.When(**{f"{field}__isnull": True}, then=0),
+                    models.When(**{field: ""}, then=0),
+                    default=1,
+                    output_field=models.IntegerField(),
+                )
+                for field in self.DOCUMENT_FIELDS
+            }
+        )
+
+
 class Consultant(models.Model):
     GENDER_CHOICES = [
         ('M', 'Male'),
@@ -86,6 +116,8 @@ class Consultant(models.Model):
     staff_comment = models.TextField(blank=True, null=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ConsultantQuerySet.as_manager()
+
     class Meta:
         constraints = [
             models.UniqueConstraint(
@@ -101,6 +133,18 @@ class Consultant(models.Model):
                 name="consultants_unique_email_per_nationality",
             ),
         ]
+        # Back the case-insensitive duplicate checks used during validation.
+        indexes = [
+            models.Index(
+                Lower("email"),
+                Lower("nationality"),
+                name="consultant_email_nat_lower_idx",
+            ),
+            models.Index(Lower("id_number"), name="consultant_id_number_lower_idx"),
+            models.Index(
+                Lower("registration_number"), name="consultant_reg_no_lower_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.full_name} ({self.status})"
@@ -168,6 +168,35 @@ def test_admin_reissue_action_dispatches_task(
     assert any("Successfully updated" in message for message, _ in messages)
 
 
+@pytest.mark.django_db
+def test_admin_regenerate_action_enqueues_batch_render(
+    request_factory,
+    admin_site,
+    staff_admin_user,
+    consultant_with_certificate,
+    monkeypatch,
+):
+    admin_instance, messages = _build_admin(request_factory, admin_site)
+    delay_mock = MagicMock()
+    monkeypatch.setattr(
+        consultant_admin_module.render_certificates_batch_task,
+        "delay",
+        delay_mock,
+    )
+
+    request = request_factory.post("/admin/consultants/consultant/")
+    request.user = staff_admin_user
+
+    queryset = Consultant.objects.filter(pk=consultant_with_certificate.pk)
+    admin_instance.action_regenerate_certificate_pdfs(request, queryset)
+
+    delay_mock.assert_called_once_with(
+        [consultant_with_certificate.pk],
+        actor_id=staff_admin_user.pk,
+    )
+    assert any("Queued certificate PDF regeneration" in message for message, _ in messages)
+
+
 @pytest.mark.django_db
 def test_admin_action_requires_reason(
     request_factory,
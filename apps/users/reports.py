@@ -12,7 +12,6 @@ from django.core.mail import EmailMessage
 from django.db.models import Count, Q
 from django.template.loader import render_to_string
 from django.utils import timezone
-from weasyprint import HTML
 
 from apps.users.analytics import (
     ANALYTICS_PENDING_STATUSES,
@@ -76,6 +75,8 @@ def render_report_pdf(
 ) -> AnalyticsReport:
     """Render the analytics report to PDF bytes."""
 
+    from weasyprint import HTML
+
     html_string = render_to_string("staff_analytics_export_pdf.html", context)
     resolved_base_url = base_url or str(getattr(settings, "BASE_DIR", "."))
     pdf_bytes = HTML(string=html_string, base_url=resolved_base_url).write_pdf()
@@ -30,7 +30,6 @@ from django.views.decorators.http import require_POST
 from urllib.parse import urlencode
 
 from PyPDF2 import PdfReader, PdfWriter
-from weasyprint import HTML
 
 from apps.consultants.emails import send_status_update_email
 from apps.consultants.forms import DocumentUploadForm
@@ -193,6 +192,8 @@ def _render_consultant_pdf(request, consultant) -> Tuple[bytes, str]:
         "generated_at": timezone.now(),
     }
 
+    from weasyprint import HTML
+
     html_string = render_to_string("consultants/application_pdf.html", context)
     pdf_bytes = HTML(string=html_string, base_url=request.build_absolute_uri("/")).write_pdf()
 
@@ -351,6 +351,29 @@ def _build_channel_layers() -> dict[str, dict[str, object]]:
 
 CHANNEL_LAYERS = _build_channel_layers()
 
+
+def _build_caches() -> dict[str, dict[str, object]]:
+    """Return a cache shared by web and worker processes when Redis is set."""
+
+    redis_url = os.getenv("CACHE_REDIS_URL") or os.getenv("REDIS_URL")
+    if redis_url:
+        return {
+            'default': {
+                'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+                'LOCATION': redis_url,
+            }
+        }
+
+    return {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
+CACHES = _build_caches()
+
+
 def _build_test_settings(parsed: dict[str, str]) -> dict[str, str]:
     """Translate a parsed database URL into a Django TEST settings block."""
 
@@ -457,6 +480,7 @@ def _build_component_config(prefix: str, *, conn_max_age: int) -> dict[str, obje
         return None
 
     config["CONN_MAX_AGE"] = conn_max_age
+    config["CONN_HEALTH_CHECKS"] = conn_max_age > 0
     return config
 
 
@@ -549,7 +573,13 @@ def build_database_config(
         parsed = dj_database_url.parse(test_url, conn_max_age=0)
         return parsed
 
-    parsed = dj_database_url.parse(database_url, conn_max_age=conn_max_age)
+    # Persistent connections are health-checked before reuse so long-lived
+    # Celery workers recover from server-side disconnects.
+    parsed = dj_database_url.parse(
+        database_url,
+        conn_max_age=conn_max_age,
+        conn_health_checks=conn_max_age > 0,
+    )
     if host_suffix:
         _apply_host_suffix(parsed, host_suffix)
     component_test_config = None
@@ -619,6 +649,8 @@ MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
 CERTIFICATE_VERIFY_BASE_URL = os.getenv("CERTIFICATE_VERIFY_BASE_URL", "")
+# Either "weasyprint" (HTML template) or "reportlab" (fixed-layout fast path).
+CERTIFICATE_PDF_ENGINE = os.getenv("CERTIFICATE_PDF_ENGINE", "weasyprint")
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -721,6 +753,11 @@ CELERY_TASK_EAGER_PROPAGATES = (
     consultant_celery_settings.CELERY_TASK_EAGER_PROPAGATES
 )
 CELERY_TASK_ACKS_LATE = consultant_celery_settings.CELERY_TASK_ACKS_LATE
+CELERY_IO_BOUND_QUEUE = consultant_celery_settings.CELERY_IO_BOUND_QUEUE
+CELERY_TASK_ROUTES = consultant_celery_settings.CELERY_TASK_ROUTES
+CELERY_WORKER_PREFETCH_MULTIPLIER = (
+    consultant_celery_settings.CELERY_WORKER_PREFETCH_MULTIPLIER
+)
 CELERY_TASK_SOFT_TIME_LIMIT = (
     consultant_celery_settings.CELERY_TASK_SOFT_TIME_LIMIT
 )
@@ -11,6 +11,7 @@ from .base import (
     build_database_config,
     get_csrf_trusted_origins,
     get_env_bool,
+    get_env_int,
     get_secret_key,
 )
 
@@ -35,7 +36,9 @@ DATABASES["default"] = build_database_config(
     "PROD_DATABASE_URL",
     fallback_env_vars=("DATABASE_URL",),
     test_env_vars=("PROD_TEST_DATABASE_URL", "TEST_DATABASE_URL"),
-    conn_max_age=600,
+    # Green-threaded workers set this to 0 so each greenlet's connection is
+    # closed at the end of its task instead of lingering.
+    conn_max_age=get_env_int("PROD_DB_CONN_MAX_AGE", 600),
 )
 
 STORAGES = {
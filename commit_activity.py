@@ -20,16 +20,16 @@ sorted_counts = [commit_counts[date] for date in sorted_dates]
 # Convert date strings to datetime objects for plotting
 date_objects = [datetime.strptime(date, "%Y-%m-%d") for date in sorted_dates]
 
-# Plot commit activity as a bar chart
-plt.figure(figsize=(12, 6))
-plt.bar(date_objects, sorted_counts, color='skyblue')
-plt.title("Git Commit Activity Over Time")
-plt.xlabel("Date")
-plt.ylabel("Number of Commits")
-plt.xticks(rotation=45)
-plt.tight_layout()
-plt.grid(True)
+# Plot commit activity as vertical lines; a single LineCollection scales to long
+# histories far better than one bar artist per active day.
+fig, ax = plt.subplots(figsize=(12, 6))
+ax.vlines(date_objects, 0, sorted_counts, colors='skyblue', linewidth=2)
+ax.set(title="Git Commit Activity Over Time", xlabel="Date", ylabel="Number of Commits")
+ax.set_ylim(bottom=0)
+ax.tick_params(axis='x', labelrotation=45)
+fig.tight_layout()
+ax.grid(True)
 
 # Save the plot
-plt.savefig("commit_activity.png")
+fig.savefig("commit_activity.png")
 plt.show()
@@ -23,6 +23,17 @@ if not SKIP_DJANGO_SETUP:
 
     User = get_user_model()
 
+    @pytest.fixture(autouse=True, scope="session")
+    def fast_password_hasher():
+        """Hash test passwords with MD5; the default PBKDF2 cost dominates user setup."""
+
+        from django.test import override_settings
+
+        with override_settings(
+            PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+        ):
+            yield
+
     @pytest.fixture
     def user_factory(db):
         def create_user(username="testuser", role=Roles.CONSULTANT):
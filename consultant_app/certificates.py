@@ -2,33 +2,84 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import logging
 import mimetypes
 import os
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Final, Optional
+from typing import TYPE_CHECKING, Any, Final, Optional, Sequence
 from urllib.parse import urlencode
 
 from django.conf import settings
 from django.core import signing
-from django.template.loader import render_to_string
-from django.urls import reverse
-from django.utils import timezone
-from weasyprint import HTML
+from django.core.cache import cache
+from django.template.loader import get_template, render_to_string
+from django.urls import get_script_prefix, get_urlconf, reverse
+from django.utils import dateformat, timezone
+from reportlab.graphics import renderPDF
+from reportlab.graphics.barcode.qr import QrCodeWidget
+from reportlab.graphics.shapes import Drawing
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen import canvas
 
 from apps.consultants.models import Consultant
 from consultant_app.models import Certificate
 
-from utils.qr_generator import generate_qr_code
+from utils.qr_generator import generate_qr_svg
+
+if TYPE_CHECKING:  # pragma: no cover - WeasyPrint is imported lazily at render time
+    from weasyprint import CSS
+    from weasyprint.text.fonts import FontConfiguration
+
+try:  # pragma: no cover - optional speed-up, falls back to Django's JSON serializer
+    import orjson
+except ImportError:  # pragma: no cover - handled gracefully at runtime
+    orjson = None
 
 _TOKEN_SALT: Final = "consultant_app.certificates.token"
+_TOKEN_CACHE_PREFIX: Final = "consultant_app.certificates.token"
+_TOKEN_CACHE_TIMEOUT: Final = 60 * 60
+
+PDF_ENGINE_WEASYPRINT: Final = "weasyprint"
+PDF_ENGINE_REPORTLAB: Final = "reportlab"
+_PDF_ENGINES: Final = frozenset({PDF_ENGINE_WEASYPRINT, PDF_ENGINE_REPORTLAB})
+
+# Fixed coordinates (in points) for the ReportLab certificate layout.
+_RL_PAGE_WIDTH, _RL_PAGE_HEIGHT = A4
+_RL_MARGIN_X: Final = 72.0
+_RL_TITLE_Y: Final = _RL_PAGE_HEIGHT - 96.0
+_RL_SUBTITLE_Y: Final = _RL_TITLE_Y - 24.0
+_RL_DETAILS_Y: Final = _RL_SUBTITLE_Y - 60.0
+_RL_LINE_HEIGHT: Final = 18.0
+_RL_QR_SIZE: Final = 140.0
+_RL_SIGNATURE_MAX_HEIGHT: Final = 90.0
+
+_BATCH_ANCHOR_PREFIX: Final = "certificate-"
+_VERIFY_PATH_PLACEHOLDER: Final = "00000000-0000-0000-0000-000000000000"
+# Multiple of 3 so each chunk base64-encodes without padding mid-stream.
+_DATA_URI_CHUNK_SIZE: Final = 3 * 16 * 1024
 
 logger = logging.getLogger(__name__)
 
 
+class _OrjsonSerializer:
+    """Signing serializer producing the same compact JSON as ``JSONSerializer``."""
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+_TOKEN_SERIALIZER: Final = _OrjsonSerializer if orjson else signing.JSONSerializer
+
+
 class CertificateTokenError(Exception):
     """Raised when a certificate token cannot be validated."""
 
@@ -53,14 +104,25 @@ def _certificate_for_consultant(consultant: Consultant) -> Certificate | None:
     if not consultant.certificate_generated_at:
         return None
 
-    issued_at_iso = consultant.certificate_generated_at.isoformat()
-    certificate = Certificate.objects.matching_issue_timestamp(
-        consultant, issued_at_iso
+    matching, active = Certificate.objects.issuance_bundle(
+        consultant, consultant.certificate_generated_at
     )
-    if certificate:
-        return certificate
+    return matching or active
+
 
-    return Certificate.objects.active_for_consultant(consultant)
+@lru_cache(maxsize=4)
+def _token_signer(secret_key: str) -> signing.TimestampSigner:
+    """Return the certificate token signer, built once per secret key."""
+
+    return signing.TimestampSigner(key=secret_key, salt=_TOKEN_SALT)
+
+
+@lru_cache(maxsize=4)
+def _token_cache_namespace(secret_key: str) -> str:
+    """Return a cache key segment identifying the signing key and salt."""
+
+    digest = hashlib.sha256(f"{_TOKEN_SALT}:{secret_key}".encode()).hexdigest()
+    return f"{_TOKEN_CACHE_PREFIX}:{digest[:16]}"
 
 
 def build_certificate_token(consultant: Consultant) -> str:
@@ -76,12 +138,27 @@ def build_certificate_token(consultant: Consultant) -> str:
     if not certificate.is_active:
         raise ValueError("Certificate is not currently valid.")
 
+    issued_at_iso = certificate.issued_at_iso
+    # Tokens are a pure function of the signing key, consultant and issue
+    # timestamp, so a reissue or a key rotation lands on a fresh cache key.
+    secret_key = settings.SECRET_KEY
+    cache_key = (
+        f"{_token_cache_namespace(secret_key)}:{consultant.pk}:{issued_at_iso}"
+    )
+    token = cache.get(cache_key)
+    if token:
+        return token
+
     payload = {
         "consultant_id": consultant.pk,
-        "issued_at": certificate.issued_at.isoformat(),
+        "issued_at": issued_at_iso,
     }
 
-    return signing.dumps(payload, salt=_TOKEN_SALT)
+    token = _token_signer(secret_key).sign_object(
+        payload, serializer=_TOKEN_SERIALIZER, compress=True
+    )
+    cache.set(cache_key, token, _TOKEN_CACHE_TIMEOUT)
+    return token
 
 
 def verify_certificate_token(token: str, consultant: Consultant) -> CertificateMetadata:
@@ -91,7 +168,9 @@ def verify_certificate_token(token: str, consultant: Consultant) -> CertificateM
         raise CertificateTokenError("Missing verification token.")
 
     try:
-        payload = signing.loads(token, salt=_TOKEN_SALT)
+        payload = _token_signer(settings.SECRET_KEY).unsign_object(
+            token, serializer=_TOKEN_SERIALIZER
+        )
     except signing.BadSignature as exc:
         logger.warning(
             "Invalid certificate token provided for consultant %s", consultant.pk, exc_info=exc
@@ -109,9 +188,6 @@ def verify_certificate_token(token: str, consultant: Consultant) -> CertificateM
     if not certificate or not certificate.issued_at:
         raise CertificateTokenError("Certificate is not currently active.")
 
-    if issued_at != certificate.issued_at.isoformat():
-        raise CertificateTokenError("Token is no longer valid for this certificate.")
-
     invalid_status_errors = {
         Certificate.Status.REVOKED: "Certificate has been revoked.",
         Certificate.Status.EXPIRED: "Certificate has expired.",
@@ -125,14 +201,24 @@ def verify_certificate_token(token: str, consultant: Consultant) -> CertificateM
     return CertificateMetadata(consultant_id=consultant.pk, issued_at=issued_at)
 
 
+@lru_cache(maxsize=8)
+def _verification_path_template(urlconf: str, script_prefix: str) -> str:
+    """Reverse the verification route once per URLconf and script prefix."""
+
+    return reverse(
+        "consultant-certificate-verify",
+        kwargs={"certificate_uuid": _VERIFY_PATH_PLACEHOLDER},
+        urlconf=urlconf,
+    )
+
+
 def build_verification_url(consultant: Consultant) -> str:
     """Return the URL embedded in the QR code for certificate verification."""
 
     token = build_certificate_token(consultant)
-    path = reverse(
-        "consultant-certificate-verify",
-        kwargs={"certificate_uuid": consultant.certificate_uuid},
-    )
+    path = _verification_path_template(
+        get_urlconf() or settings.ROOT_URLCONF, get_script_prefix()
+    ).replace(_VERIFY_PATH_PLACEHOLDER, str(consultant.certificate_uuid))
 
     base_url = getattr(settings, "CERTIFICATE_VERIFY_BASE_URL", "")
     if base_url:
@@ -144,6 +230,42 @@ def build_verification_url(consultant: Consultant) -> str:
     return f"{path}?{query}"
 
 
+@lru_cache(maxsize=32)
+def _file_to_data_uri(path: str, mtime_ns: int, size: int) -> str:
+    """Encode a file as a data URI; ``mtime_ns``/``size`` invalidate the cache."""
+
+    data = Path(path).read_bytes()
+    mime, _ = mimetypes.guess_type(path)
+    mime = mime or "image/png"
+    encoded = base64.b64encode(data).decode("ascii")
+    return f"data:{mime};base64,{encoded}"
+
+
+def _path_to_data_uri(path: str | os.PathLike[str]) -> str:
+    stat = os.stat(path)
+    return _file_to_data_uri(os.fspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _stream_to_base64(stream: Any) -> str:
+    """Base64-encode a readable stream chunk by chunk, rewinding it afterwards."""
+
+    encoded = bytearray()
+    pending = b""
+    try:
+        for chunk in iter(lambda: stream.read(_DATA_URI_CHUNK_SIZE), b""):
+            pending += chunk
+            usable = len(pending) - len(pending) % 3
+            encoded += base64.b64encode(pending[:usable])
+            pending = pending[usable:]
+    finally:
+        try:
+            stream.seek(0)
+        except (AttributeError, OSError):
+            pass
+    encoded += base64.b64encode(pending)
+    return encoded.decode("ascii")
+
+
 def _image_to_data_uri(image: object | None) -> str | None:
     """Return a data URI for the provided image-like object, when possible."""
 
@@ -161,32 +283,19 @@ def _image_to_data_uri(image: object | None) -> str | None:
                 potential_path = Path(media_root) / image
 
         if potential_path.exists():
-            data = potential_path.read_bytes()
-            mime, _ = mimetypes.guess_type(potential_path.name)
-            mime = mime or "image/png"
-            encoded = base64.b64encode(data).decode("ascii")
-            return f"data:{mime};base64,{encoded}"
+            return _path_to_data_uri(potential_path)
 
         return image
 
     file_path = getattr(image, "path", None)
     if file_path and os.path.exists(file_path):
-        data = Path(file_path).read_bytes()
-        mime, _ = mimetypes.guess_type(file_path)
-        mime = mime or "image/png"
-        encoded = base64.b64encode(data).decode("ascii")
-        return f"data:{mime};base64,{encoded}"
+        return _path_to_data_uri(file_path)
 
     if hasattr(image, "read"):
-        try:
-            data = image.read()
-        finally:
-            if hasattr(image, "seek"):
-                image.seek(0)
-        if not data:
+        encoded = _stream_to_base64(image)
+        if not encoded:
             return None
         mime = mimetypes.guess_type(getattr(image, "name", ""))[0] or "image/png"
-        encoded = base64.b64encode(data).decode("ascii")
         return f"data:{mime};base64,{encoded}"
 
     url = getattr(image, "url", None)
@@ -196,6 +305,214 @@ def _image_to_data_uri(image: object | None) -> str | None:
     return None
 
 
+def _image_to_render_uri(image: object | None) -> str | None:
+    """Return an image reference for WeasyPrint, preferring local file URIs.
+
+    WeasyPrint reads ``file://`` images straight from disk, which keeps the HTML
+    small and skips the base64 round-trip; anything not on the local filesystem
+    falls back to :func:`_image_to_data_uri`.
+    """
+
+    file_path: str | os.PathLike[str] | None = None
+    if isinstance(image, str):
+        if image and not image.startswith(("data:", "http", "file:")):
+            file_path = Path(image)
+            if not file_path.is_absolute():
+                media_root = getattr(settings, "MEDIA_ROOT", "")
+                if media_root:
+                    file_path = Path(media_root) / image
+    elif image:
+        file_path = getattr(image, "path", None)
+
+    if file_path and os.path.isfile(file_path):
+        return Path(file_path).resolve().as_uri()
+
+    return _image_to_data_uri(image)
+
+
+def _certificate_context(
+    consultant: Consultant,
+    *,
+    issued_at: date,
+    verification_url: str,
+    signer_name: str,
+    signing_datetime: datetime,
+    signature_image: str | None,
+) -> dict[str, object]:
+    """Return the template context for a single certificate."""
+
+    return {
+        "consultant": consultant,
+        "issued_at": issued_at,
+        "verification_url": verification_url,
+        "qr_svg": generate_qr_svg(verification_url, box_size=8, border=2),
+        "signer_name": signer_name,
+        "signing_datetime": signing_datetime,
+        "signature_image": signature_image,
+    }
+
+
+def _local_issue_date(consultant: Consultant) -> date:
+    if consultant.certificate_generated_at:
+        return timezone.localtime(consultant.certificate_generated_at).date()
+    return timezone.localdate()
+
+
+def _pdf_base_url(request: Optional[object]) -> str | os.PathLike[str] | None:
+    return getattr(settings, "MEDIA_ROOT", "") or (
+        request.build_absolute_uri("/") if request else None
+    )
+
+
+@lru_cache(maxsize=1)
+def _font_config() -> FontConfiguration:
+    """Return the shared WeasyPrint font configuration, so font lookups are reused."""
+
+    from weasyprint.text.fonts import FontConfiguration
+
+    return FontConfiguration()
+
+
+@lru_cache(maxsize=1)
+def _certificate_stylesheet() -> CSS:
+    """Return the parsed certificate stylesheet, built once per process."""
+
+    from weasyprint import CSS
+
+    return CSS(
+        string=get_template("certificate_styles.css").render(),
+        font_config=_font_config(),
+    )
+
+
+def _weasyprint_options() -> dict[str, object]:
+    """Return the render options shared by every certificate WeasyPrint pass."""
+
+    return {
+        "stylesheets": [_certificate_stylesheet()],
+        "font_config": _font_config(),
+        "presentational_hints": False,
+        # The QR code and signature are already encoded; skip re-compressing them.
+        "optimize_images": False,
+    }
+
+
+def _build_certificate_canvas(buffer: BytesIO) -> canvas.Canvas:
+    """Return a ReportLab canvas configured for the certificate layout."""
+
+    pdf = canvas.Canvas(buffer, pagesize=A4, pageCompression=1)
+    pdf.setTitle("Consultant Approval Certificate")
+    return pdf
+
+
+def _render_certificate_reportlab(
+    consultant: Consultant,
+    *,
+    issued_at: date,
+    verification_url: str,
+    signer_name: str,
+    signing_datetime: datetime,
+    signature_image: object | None,
+) -> BytesIO:
+    """Draw the fixed-layout certificate directly with ReportLab primitives."""
+
+    buffer = BytesIO()
+    pdf = _build_certificate_canvas(buffer)
+
+    pdf.setFont("Helvetica-Bold", 22)
+    pdf.drawCentredString(
+        _RL_PAGE_WIDTH / 2, _RL_TITLE_Y, "CONSULTANT APPROVAL CERTIFICATE"
+    )
+    pdf.setFont("Helvetica", 11)
+    pdf.drawCentredString(
+        _RL_PAGE_WIDTH / 2,
+        _RL_SUBTITLE_Y,
+        "This document confirms the consultant's registration status.",
+    )
+
+    details = [
+        ("Name", consultant.full_name),
+        ("Registration Number", consultant.registration_number or "N/A"),
+        ("Issued on", dateformat.format(issued_at, "j F Y")),
+    ]
+    if consultant.certificate_expires_at:
+        details.append(
+            ("Valid until", dateformat.format(consultant.certificate_expires_at, "j F Y"))
+        )
+
+    y = _RL_DETAILS_Y
+    pdf.setFont("Helvetica-Bold", 14)
+    pdf.drawString(_RL_MARGIN_X, y, "Consultant Information")
+    for label, value in details:
+        y -= _RL_LINE_HEIGHT
+        pdf.setFont("Helvetica-Bold", 11)
+        pdf.drawString(_RL_MARGIN_X, y, f"{label}:")
+        pdf.setFont("Helvetica", 11)
+        pdf.drawString(_RL_MARGIN_X + 130, y, str(value))
+
+    y -= _RL_LINE_HEIGHT * 2
+    pdf.setFont("Helvetica-Bold", 14)
+    pdf.drawString(_RL_MARGIN_X, y, "Verification")
+
+    qr_widget = QrCodeWidget(verification_url, barLevel="M", barBorder=2)
+    x1, y1, x2, y2 = qr_widget.getBounds()
+    qr_drawing = Drawing(
+        _RL_QR_SIZE,
+        _RL_QR_SIZE,
+        transform=[_RL_QR_SIZE / (x2 - x1), 0, 0, _RL_QR_SIZE / (y2 - y1), 0, 0],
+    )
+    qr_drawing.add(qr_widget)
+    y -= _RL_QR_SIZE + 8
+    renderPDF.draw(qr_drawing, pdf, _RL_MARGIN_X, y)
+
+    pdf.setFont("Helvetica", 10)
+    text = pdf.beginText(_RL_MARGIN_X + _RL_QR_SIZE + 24, y + _RL_QR_SIZE - 20)
+    text.textLine("Scan the QR code or use the link below to confirm this certificate.")
+    for offset in range(0, len(verification_url), 60):
+        text.textLine(verification_url[offset : offset + 60])
+    pdf.drawText(text)
+
+    y -= _RL_LINE_HEIGHT * 2
+    pdf.setFont("Helvetica-Bold", 14)
+    pdf.drawString(_RL_MARGIN_X, y, "Authorized Signatory")
+
+    signature_uri = _image_to_data_uri(signature_image)
+    if signature_uri and signature_uri.startswith("data:"):
+        y -= _RL_SIGNATURE_MAX_HEIGHT + 8
+        pdf.drawImage(
+            ImageReader(signature_uri),
+            _RL_MARGIN_X,
+            y,
+            height=_RL_SIGNATURE_MAX_HEIGHT,
+            width=_RL_SIGNATURE_MAX_HEIGHT * 2,
+            preserveAspectRatio=True,
+            anchor="sw",
+            mask="auto",
+        )
+
+    signed_at = (
+        timezone.localtime(signing_datetime)
+        if timezone.is_aware(signing_datetime)
+        else signing_datetime
+    )
+    y -= _RL_LINE_HEIGHT * 1.5
+    pdf.line(_RL_MARGIN_X, y + 14, _RL_MARGIN_X + 220, y + 14)
+    pdf.setFont("Helvetica-Bold", 11)
+    pdf.drawString(_RL_MARGIN_X, y, signer_name)
+    pdf.setFont("Helvetica", 11)
+    pdf.drawString(
+        _RL_MARGIN_X,
+        y - _RL_LINE_HEIGHT,
+        f"Signed on {dateformat.format(signed_at, 'j F Y')} at "
+        f"{dateformat.time_format(signed_at, 'H:i')}",
+    )
+
+    pdf.showPage()
+    pdf.save()
+    buffer.seek(0)
+    return buffer
+
+
 def render_certificate_pdf(
     consultant: Consultant,
     *,
@@ -205,41 +522,141 @@ def render_certificate_pdf(
     signature_image: object | None = None,
     signing_datetime: Optional[datetime] = None,
     request: Optional[object] = None,
+    engine: Optional[str] = None,
 ) -> BytesIO:
-    """Render the certificate PDF bytes including a QR code."""
+    """Render the certificate PDF bytes including a QR code.
 
-    qr_image = generate_qr_code(verification_url, box_size=8, border=2)
-    qr_buffer = BytesIO()
-    qr_image.save(qr_buffer, format="PNG")
-    qr_data_uri = "data:image/png;base64," + base64.b64encode(qr_buffer.getvalue()).decode(
-        "ascii"
-    )
+    ``engine`` selects between the WeasyPrint HTML template and the ReportLab
+    fast path; it defaults to ``settings.CERTIFICATE_PDF_ENGINE``.
+    """
+
+    engine = engine or getattr(settings, "CERTIFICATE_PDF_ENGINE", PDF_ENGINE_WEASYPRINT)
+    if engine not in _PDF_ENGINES:
+        raise ValueError(f"Unsupported certificate PDF engine: {engine}")
 
     signer_name = generated_by or ""
     signing_time = signing_datetime or timezone.now()
 
-    context = {
-        "consultant": consultant,
-        "issued_at": issued_at,
-        "verification_url": verification_url,
-        "qr_code_data_uri": qr_data_uri,
-        "signer_name": signer_name,
-        "signing_datetime": signing_time,
-        "signature_image": _image_to_data_uri(signature_image),
-    }
-
-    rendered_html = render_to_string("certificate_template.html", context)
+    if engine == PDF_ENGINE_REPORTLAB:
+        return _render_certificate_reportlab(
+            consultant,
+            issued_at=issued_at,
+            verification_url=verification_url,
+            signer_name=signer_name,
+            signing_datetime=signing_time,
+            signature_image=signature_image,
+        )
 
-    base_url = getattr(settings, "MEDIA_ROOT", "") or (
-        request.build_absolute_uri("/") if request else None
+    context = _certificate_context(
+        consultant,
+        issued_at=issued_at,
+        verification_url=verification_url,
+        signer_name=signer_name,
+        signing_datetime=signing_time,
+        signature_image=_image_to_render_uri(signature_image),
     )
 
+    from weasyprint import HTML
+
+    rendered_html = render_to_string("certificate_template.html", context)
+
     buffer = BytesIO()
-    HTML(string=rendered_html, base_url=base_url).write_pdf(target=buffer)
+    HTML(string=rendered_html, base_url=_pdf_base_url(request)).write_pdf(
+        target=buffer, **_weasyprint_options()
+    )
     buffer.seek(0)
     return buffer
 
 
+def render_certificates_batch(
+    consultants: Sequence[Consultant],
+    *,
+    issued_at: date | None = None,
+    generated_by: Optional[str] = None,
+    signature_image: object | None = None,
+    signing_datetime: Optional[datetime] = None,
+    request: Optional[object] = None,
+    engine: Optional[str] = None,
+) -> list[BytesIO]:
+    """Render certificate PDFs for several consultants in one WeasyPrint pass.
+
+    The certificates are laid out as a single multi-page document, which is then
+    split back into one PDF per consultant, in the order given. When ``issued_at``
+    is omitted each certificate shows its consultant's own issue date.
+
+    ``engine`` defaults to ``settings.CERTIFICATE_PDF_ENGINE`` like
+    :func:`render_certificate_pdf`; the ReportLab engine has no shared setup
+    to amortise, so it renders each certificate on its own.
+    """
+
+    engine = engine or getattr(settings, "CERTIFICATE_PDF_ENGINE", PDF_ENGINE_WEASYPRINT)
+    if engine not in _PDF_ENGINES:
+        raise ValueError(f"Unsupported certificate PDF engine: {engine}")
+
+    if not consultants:
+        return []
+
+    signer_name = generated_by or ""
+    signing_time = signing_datetime or timezone.now()
+
+    if engine == PDF_ENGINE_REPORTLAB:
+        return [
+            _render_certificate_reportlab(
+                consultant,
+                issued_at=issued_at or _local_issue_date(consultant),
+                verification_url=build_verification_url(consultant),
+                signer_name=signer_name,
+                signing_datetime=signing_time,
+                signature_image=signature_image,
+            )
+            for consultant in consultants
+        ]
+
+    signature_uri = _image_to_render_uri(signature_image)
+
+    certificates = [
+        _certificate_context(
+            consultant,
+            issued_at=issued_at or _local_issue_date(consultant),
+            verification_url=build_verification_url(consultant),
+            signer_name=signer_name,
+            signing_datetime=signing_time,
+            signature_image=signature_uri,
+        )
+        for consultant in consultants
+    ]
+    rendered_html = render_to_string(
+        "certificate_batch_template.html", {"certificates": certificates}
+    )
+
+    from weasyprint import HTML
+
+    document = HTML(string=rendered_html, base_url=_pdf_base_url(request)).render(
+        **_weasyprint_options()
+    )
+
+    # Each certificate is wrapped in an element with a ``certificate-<index>`` id;
+    # the page where that anchor first appears is where the certificate starts.
+    start_pages: dict[int, int] = {}
+    for page_index, page in enumerate(document.pages):
+        for anchor in page.anchors:
+            if anchor.startswith(_BATCH_ANCHOR_PREFIX):
+                start_pages.setdefault(
+                    int(anchor[len(_BATCH_ANCHOR_PREFIX) :]), page_index
+                )
+
+    starts = [start_pages[index] for index in range(len(certificates))]
+    ends = starts[1:] + [len(document.pages)]
+
+    buffers = []
+    for start, end in zip(starts, ends):
+        buffer = BytesIO()
+        document.copy(document.pages[start:end]).write_pdf(target=buffer)
+        buffer.seek(0)
+        buffers.append(buffer)
+    return buffers
+
+
 def update_certificate_status(
     consultant: Consultant,
     *,
@@ -330,10 +747,13 @@ def decode_certificate_metadata(token: str, consultant: Consultant) -> dict[str,
 __all__ = [
     "CertificateMetadata",
     "CertificateTokenError",
+    "PDF_ENGINE_REPORTLAB",
+    "PDF_ENGINE_WEASYPRINT",
     "build_certificate_token",
     "build_verification_url",
     "decode_certificate_metadata",
     "render_certificate_pdf",
+    "render_certificates_batch",
     "update_certificate_status",
     "verify_certificate_token",
 ]
@@ -0,0 +1,47 @@
+"""Denormalize the serialized certificate issue timestamp."""
+
+from datetime import timezone as dt_timezone
+
+from django.db import migrations, models
+
+
+def populate_issued_at_iso(apps, schema_editor):
+    Certificate = apps.get_model("consultant_app", "Certificate")
+
+    rows = (
+        Certificate.objects.exclude(issued_at__isnull=True)
+        .values_list("pk", "issued_at")
+        .iterator(chunk_size=2000)
+    )
+    pending = [
+        Certificate(
+            pk=pk,
+            issued_at_iso=issued_at.astimezone(dt_timezone.utc).isoformat(),
+        )
+        for pk, issued_at in rows
+    ]
+
+    Certificate.objects.bulk_update(pending, ["issued_at_iso"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("consultant_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="certificate",
+            name="issued_at_iso",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="Serialized issue timestamp used to match verification tokens.",
+                max_length=32,
+                null=True,
+            ),
+        ),
+        migrations.RunPython(populate_issued_at_iso, migrations.RunPython.noop),
+    ]
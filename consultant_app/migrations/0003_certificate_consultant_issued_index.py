@@ -0,0 +1,21 @@
+"""Index certificate history in the order the manager helpers read it."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("consultant_app", "0002_certificate_issued_at_iso"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="certificate",
+            index=models.Index(
+                fields=["consultant", "-issued_at", "-status_set_at", "-id"],
+                include=("status",),
+                name="cert_consult_issued_idx",
+            ),
+        ),
+    ]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone as dt_timezone
 
 from django.db import models
 from django.utils import timezone
@@ -23,6 +23,16 @@ class CertificateQuerySet(models.QuerySet):
         return self.filter(consultant=consultant)
 
 
+def _with_consultant(
+    certificate: "Certificate | None", consultant: BaseConsultant
+) -> "Certificate | None":
+    """Reuse the caller's consultant instance instead of lazily re-fetching it."""
+
+    if certificate is not None:
+        certificate.consultant = consultant
+    return certificate
+
+
 class CertificateManager(models.Manager["Certificate"]):
     """Manager providing helpers for fetching certificate records."""
 
@@ -34,12 +44,13 @@ class CertificateManager(models.Manager["Certificate"]):
     ) -> "Certificate | None":
         """Return the latest active certificate for the consultant."""
 
-        return (
+        return _with_consultant(
             self.get_queryset()
             .for_consultant(consultant)
             .active()
             .order_by("-issued_at", "-status_set_at", "-pk")
-            .first()
+            .first(),
+            consultant,
         )
 
     def latest_for_consultant(
@@ -52,29 +63,64 @@ class CertificateManager(models.Manager["Certificate"]):
             records = prefetched.get("certificate_records") or []
             return records[0] if records else None
 
-        return (
+        return _with_consultant(
             self.get_queryset()
             .for_consultant(consultant)
             .order_by("-issued_at", "-status_set_at", "-pk")
-            .first()
+            .first(),
+            consultant,
         )
 
+    def issuance_bundle(
+        self, consultant: BaseConsultant, issued_at: datetime | None
+    ) -> "tuple[Certificate | None, Certificate | None]":
+        """Return ``(matching, active)`` certificates for the consultant in one query.
+
+        ``matching`` is the most recent record issued at ``issued_at`` and
+        ``active`` the most recent currently valid record; either may be ``None``.
+        """
+
+        candidates = models.Q(status__in=Certificate.ACTIVE_STATUSES)
+        if issued_at is not None:
+            candidates |= models.Q(issued_at=issued_at)
+
+        matching = active = None
+        for certificate in (
+            self.get_queryset()
+            .for_consultant(consultant)
+            .filter(candidates)
+            .order_by("-issued_at", "-status_set_at", "-pk")
+        ):
+            _with_consultant(certificate, consultant)
+            if issued_at is not None and certificate.issued_at == issued_at:
+                if matching is None or certificate.pk > matching.pk:
+                    matching = certificate
+            if active is None and certificate.is_active:
+                active = certificate
+
+        return matching, active
+
     def matching_issue_timestamp(
         self, consultant: BaseConsultant, issued_at: str
     ) -> "Certificate | None":
         """Return the certificate that matches the serialized ``issued_at`` value."""
 
-        try:
-            parsed = datetime.fromisoformat(issued_at)
-        except ValueError:
-            return None
+        prefetched = getattr(consultant, "_prefetched_objects_cache", None)
+        if prefetched and "certificate_records" in prefetched:
+            matches = [
+                record
+                for record in prefetched.get("certificate_records") or []
+                if record.issued_at_iso == issued_at
+            ]
+            return max(matches, key=lambda record: record.pk, default=None)
 
-        return (
+        return _with_consultant(
             self.get_queryset()
             .for_consultant(consultant)
-            .filter(issued_at=parsed)
+            .filter(issued_at_iso=issued_at)
             .order_by("-pk")
-            .first()
+            .first(),
+            consultant,
         )
 
 
@@ -105,6 +151,14 @@ class Certificate(models.Model):
         null=True,
         help_text="Timestamp when the certificate was issued.",
     )
+    issued_at_iso = models.CharField(
+        max_length=32,
+        blank=True,
+        null=True,
+        db_index=True,
+        editable=False,
+        help_text="Serialized issue timestamp used to match verification tokens.",
+    )
     status_set_at = models.DateTimeField(
         default=timezone.now,
         help_text="Timestamp when the current status was applied.",
@@ -140,12 +194,36 @@ class Certificate(models.Model):
 
     class Meta:
         ordering = ("-issued_at", "-status_set_at", "-pk")
+        indexes = [
+            models.Index(
+                fields=["consultant", "-issued_at", "-status_set_at", "-id"],
+                name="cert_consult_issued_idx",
+                include=["status"],
+            ),
+        ]
         verbose_name = "Consultant certificate"
         verbose_name_plural = "Consultant certificates"
 
     def __str__(self) -> str:  # pragma: no cover - human readable representation
         return f"Certificate<{self.consultant_id}:{self.get_status_display()}>"
 
+    @staticmethod
+    def serialize_issued_at(issued_at: datetime | None) -> str | None:
+        """Return the canonical UTC ISO representation stored in ``issued_at_iso``."""
+
+        if issued_at is None:
+            return None
+        if timezone.is_aware(issued_at):
+            issued_at = issued_at.astimezone(dt_timezone.utc)
+        return issued_at.isoformat()
+
+    def save(self, *args, **kwargs) -> None:
+        self.issued_at_iso = self.serialize_issued_at(self.issued_at)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "issued_at" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "issued_at_iso"}
+        super().save(*args, **kwargs)
+
     @property
     def is_active(self) -> bool:
         """Return ``True`` when the certificate is currently valid."""
@@ -159,38 +237,50 @@ class Certificate(models.Model):
         reason: str | None = None,
         timestamp: datetime | None = None,
     ) -> None:
-        """Apply a new status and persist timestamp bookkeeping."""
+        """Apply a new status and persist timestamp bookkeeping.
+
+        Only the columns touched by the transition are written.
+        """
 
         now = timestamp or timezone.now()
         self.status = status
         self.status_set_at = now
+        update_fields = ["status", "status_set_at", "updated_at"]
 
-        if status == self.Status.VALID:
-            self.valid_at = self.valid_at or now
-            self.revoked_at = None
-            self.expired_at = None
-        elif status == self.Status.REVOKED:
-            self.revoked_at = now
-        elif status == self.Status.EXPIRED:
-            self.expired_at = now
-        elif status == self.Status.REISSUED:
-            self.reissued_at = now
+        mark_transition = self._STATUS_TRANSITIONS.get(status)
+        if mark_transition is not None:
+            update_fields.extend(mark_transition(self, now))
 
         if reason is not None:
             self.status_reason = reason
-
-        self.save(
-            update_fields=[
-                "status",
-                "status_set_at",
-                "valid_at",
-                "revoked_at",
-                "expired_at",
-                "reissued_at",
-                "status_reason",
-                "updated_at",
-            ]
-        )
+            update_fields.append("status_reason")
+
+        self.save(update_fields=update_fields)
+
+    def _mark_valid(self, now: datetime) -> tuple[str, ...]:
+        self.valid_at = self.valid_at or now
+        self.revoked_at = None
+        self.expired_at = None
+        return ("valid_at", "revoked_at", "expired_at")
+
+    def _mark_revoked(self, now: datetime) -> tuple[str, ...]:
+        self.revoked_at = now
+        return ("revoked_at",)
+
+    def _mark_expired(self, now: datetime) -> tuple[str, ...]:
+        self.expired_at = now
+        return ("expired_at",)
+
+    def _mark_reissued(self, now: datetime) -> tuple[str, ...]:
+        self.reissued_at = now
+        return ("reissued_at",)
+
+    _STATUS_TRANSITIONS = {
+        Status.VALID: _mark_valid,
+        Status.REVOKED: _mark_revoked,
+        Status.EXPIRED: _mark_expired,
+        Status.REISSUED: _mark_reissued,
+    }
 
 
 class Consultant(BaseConsultant):
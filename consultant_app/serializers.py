@@ -2,24 +2,146 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, List, Mapping
 
-from django import forms
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db.models import Exists, Q, QuerySet, Value
+from django.db.models.functions import Lower
 from django.utils import timezone
 
 from apps.consultants.models import Consultant
 from consultant_app.models import Certificate, LogEntry
 
+#: Display labels for consultant statuses, resolved once instead of per row.
+_STATUS_DISPLAY = dict(Consultant.STATUS_CHOICES)
 
-class ConsultantValidationSerializer(forms.Form):
-    """Validate consultant uniqueness constraints via JSON payload."""
 
-    email = forms.EmailField(required=False)
-    nationality = forms.CharField(required=False)
-    id_number = forms.CharField(required=False)
-    registration_number = forms.CharField(required=False)
-    consultant_id = forms.IntegerField(required=False, min_value=1)
+@lru_cache(maxsize=4096)
+def _local_isoformat(value, tz) -> str:
+    """Return ``value`` as ISO 8601, converting aware datetimes to ``tz``.
+
+    The timezone is passed in rather than bound at import time so that
+    ``timezone.activate`` and ``override_settings(TIME_ZONE=...)`` apply.
+    Results are memoized on ``(value, tz)``; equal aware datetimes denote
+    the same instant and therefore render identically in ``tz``.
+    """
+
+    if value.tzinfo is not None:
+        value = value.astimezone(tz)
+    return value.isoformat()
+
+
+@dataclass(frozen=True)
+class ConsultantValidationPayload:
+    """Normalized identifiers submitted to the validation endpoint."""
+
+    email: str | None = None
+    nationality: str | None = None
+    id_number: str | None = None
+    registration_number: str | None = None
+    consultant_id: int | None = None
+
+    TEXT_FIELDS: ClassVar[tuple[str, ...]] = (
+        "email",
+        "nationality",
+        "id_number",
+        "registration_number",
+    )
+
+    @classmethod
+    def parse(
+        cls, data: Mapping[str, Any]
+    ) -> tuple["ConsultantValidationPayload", Dict[str, List[str]]]:
+        """Coerce ``data`` and return the payload with any field errors."""
+
+        values: Dict[str, Any] = {}
+        errors: Dict[str, List[str]] = {}
+
+        for field in cls.TEXT_FIELDS:
+            raw = data.get(field)
+            values[field] = (str(raw).strip() or None) if raw is not None else None
+
+        if values["email"]:
+            try:
+                validate_email(values["email"])
+            except ValidationError as exc:
+                errors["email"] = list(exc.messages)
+                values["email"] = None
+
+        raw_id = data.get("consultant_id")
+        if raw_id not in (None, ""):
+            try:
+                consultant_id = int(str(raw_id).strip())
+            except ValueError:
+                errors["consultant_id"] = ["Enter a whole number."]
+            else:
+                if consultant_id < 1:
+                    errors["consultant_id"] = [
+                        "Ensure this value is greater than or equal to 1."
+                    ]
+                else:
+                    values["consultant_id"] = consultant_id
+
+        return cls(**values), errors
+
+
+def find_duplicate_fields(payload: ConsultantValidationPayload) -> List[str]:
+    """Return the payload fields that clash with another consultant.
+
+    Each supplied field becomes an EXISTS probe; all probes are evaluated
+    together in a single statement.
+    """
+
+    # Compare ``LOWER(column)`` so the probes match the functional indexes on
+    # the consultant table; ``__iexact`` compiles to ``UPPER()`` on PostgreSQL
+    # and ``LIKE`` on SQLite, which neither index can serve.
+    branches: Dict[str, Q] = {}
+    if payload.email:
+        email_branch = Q(email_lower=Lower(Value(payload.email)))
+        if payload.nationality:
+            email_branch &= Q(nationality_lower=Lower(Value(payload.nationality)))
+        branches["email"] = email_branch
+    if payload.id_number:
+        branches["id_number"] = Q(id_number_lower=Lower(Value(payload.id_number)))
+    if payload.registration_number:
+        branches["registration_number"] = Q(
+            registration_number_lower=Lower(Value(payload.registration_number))
+        )
+
+    if not branches:
+        return []
+
+    candidates = Consultant.objects.alias(
+        email_lower=Lower("email"),
+        nationality_lower=Lower("nationality"),
+        id_number_lower=Lower("id_number"),
+        registration_number_lower=Lower("registration_number"),
+    )
+    if payload.consultant_id:
+        candidates = candidates.exclude(pk=payload.consultant_id)
+
+    annotations = {
+        f"duplicate_{field}": Exists(candidates.filter(branch))
+        for field, branch in branches.items()
+    }
+    # Any single row can carry the EXISTS columns; an empty table has no
+    # duplicates to report.
+    row = next(
+        iter(
+            Consultant.objects.order_by()
+            .annotate(**annotations)
+            .values(*annotations)[:1]
+        ),
+        {},
+    )
+    return [field for field in branches if row.get(f"duplicate_{field}")]
+
+
+class ConsultantValidationSerializer:
+    """Validate consultant uniqueness constraints via JSON payload."""
 
     error_messages = {
         "duplicate_email": "A consultant with this email already exists.",
@@ -27,46 +149,34 @@ class ConsultantValidationSerializer(forms.Form):
         "duplicate_registration": "A consultant with this registration number already exists.",
     }
 
-    def clean(self) -> Dict[str, Any]:  # type: ignore[override]
-        cleaned = super().clean()
-        consultant_id = cleaned.get("consultant_id")
-
-        def exclude_current(queryset):
-            if consultant_id:
-                return queryset.exclude(pk=consultant_id)
-            return queryset
-
-        errors: Dict[str, str] = {}
-
-        email = cleaned.get("email")
-        nationality = cleaned.get("nationality")
-        if email:
-            queryset = Consultant.objects.filter(email__iexact=email)
-            if nationality:
-                queryset = queryset.filter(nationality__iexact=nationality)
-            if exclude_current(queryset).exists():
-                errors["email"] = self.error_messages["duplicate_email"]
-
-        id_number = cleaned.get("id_number")
-        if id_number:
-            queryset = Consultant.objects.filter(id_number__iexact=id_number)
-            if exclude_current(queryset).exists():
-                errors["id_number"] = self.error_messages["duplicate_id"]
-
-        registration_number = cleaned.get("registration_number") or None
-        if registration_number:
-            queryset = Consultant.objects.filter(
-                registration_number__iexact=registration_number
-            )
-            if exclude_current(queryset).exists():
-                errors["registration_number"] = self.error_messages[
-                    "duplicate_registration"
-                ]
+    _DUPLICATE_ERROR_KEYS = {
+        "email": "duplicate_email",
+        "id_number": "duplicate_id",
+        "registration_number": "duplicate_registration",
+    }
 
-        if errors:
-            raise forms.ValidationError(errors)
+    def __init__(self, data: Mapping[str, Any] | None = None) -> None:
+        self.data = data or {}
+        self._errors: Dict[str, List[str]] | None = None
+        self.cleaned_data: Dict[str, Any] = {}
 
-        return cleaned
+    @property
+    def errors(self) -> Dict[str, List[str]]:
+        if self._errors is None:
+            self.full_clean()
+        return self._errors  # type: ignore[return-value]
+
+    def is_valid(self) -> bool:
+        return not self.errors
+
+    def full_clean(self) -> None:
+        payload, errors = ConsultantValidationPayload.parse(self.data)
+        for field in find_duplicate_fields(payload):
+            errors.setdefault(field, []).append(
+                self.error_messages[self._DUPLICATE_ERROR_KEYS[field]]
+            )
+        self._errors = errors
+        self.cleaned_data = {} if errors else asdict(payload)
 
 
 @dataclass
@@ -84,13 +194,39 @@ class ConsultantDashboardSerializer:
         "qualifications": "Qualifications",
         "business_certificate": "Business certificate",
     }
+    DOCUMENT_LABEL_ITEMS = tuple(DOCUMENT_LABELS.items())
+
+    #: Consultant columns read by :attr:`data`.
+    FIELDS = (
+        "pk",
+        "full_name",
+        "email",
+        "status",
+        "submitted_at",
+        "updated_at",
+        "certificate_expires_at",
+    )
 
-    def _serialize_datetime(self, value):
+    @classmethod
+    def prepare_queryset(cls, queryset: QuerySet[Consultant]) -> QuerySet[Consultant]:
+        """Load the serialized columns, document flags and certificate history."""
+
+        return (
+            queryset.with_document_flags()
+            .only(*cls.FIELDS)
+            .prefetch_related("certificate_records")
+        )
+
+    @classmethod
+    def from_queryset(cls, queryset: QuerySet[Consultant]) -> List[Dict[str, Any]]:
+        """Serialize every consultant in ``queryset``."""
+
+        return [cls(consultant).data for consultant in cls.prepare_queryset(queryset)]
+
+    def _serialize_datetime(self, value, tz=None):
         if not value:
             return None
-        if timezone.is_aware(value):
-            value = timezone.localtime(value)
-        return value.isoformat()
+        return _local_isoformat(value, tz or timezone.get_current_timezone())
 
     def _serialize_date(self, value):
         if not value:
@@ -98,16 +234,21 @@ class ConsultantDashboardSerializer:
         return value.isoformat()
 
     def _missing_documents(self) -> List[str]:
-        missing: List[str] = []
         consultant = self.consultant
-        for field, label in self.DOCUMENT_LABELS.items():
-            if not getattr(consultant, field):
+        missing = []
+        for field, label in self.DOCUMENT_LABEL_ITEMS:
+            # Prefer the flags annotated by ``with_document_flags``.
+            flag = getattr(consultant, f"_has_{field}", None)
+            if flag is None:
+                flag = getattr(consultant, field)
+            if not flag:
                 missing.append(label)
         return missing
 
     @property
     def data(self) -> Dict[str, Any]:
         consultant = self.consultant
+        tz = timezone.get_current_timezone()
         missing_documents = self._missing_documents()
         certificate_record = Certificate.objects.latest_for_consultant(consultant)
         certificate_status = (
@@ -121,9 +262,9 @@ class ConsultantDashboardSerializer:
             "name": consultant.full_name,
             "email": consultant.email,
             "status": consultant.status,
-            "status_display": consultant.get_status_display(),
-            "submitted_at": self._serialize_datetime(consultant.submitted_at),
-            "updated_at": self._serialize_datetime(consultant.updated_at),
+            "status_display": _STATUS_DISPLAY.get(consultant.status, consultant.status),
+            "submitted_at": self._serialize_datetime(consultant.submitted_at, tz),
+            "updated_at": self._serialize_datetime(consultant.updated_at, tz),
             "certificate_expires_at": self._serialize_date(
                 consultant.certificate_expires_at
             ),
@@ -146,11 +287,20 @@ class LogEntrySerializer:
     def __init__(self, entry: LogEntry):
         self.entry = entry
 
+    @staticmethod
+    def prepare_queryset(queryset: QuerySet[LogEntry]) -> QuerySet[LogEntry]:
+        """Return ``queryset`` with the related user joined for serialization.
+
+        :attr:`data` reads ``entry.user`` for every row, so callers serializing
+        many entries should route their queryset through this helper.
+        """
+
+        return queryset.select_related("user")
+
     def _serialize_timestamp(self):
-        timestamp = self.entry.timestamp
-        if timezone.is_aware(timestamp):
-            timestamp = timezone.localtime(timestamp)
-        return timestamp.isoformat()
+        return _local_isoformat(
+            self.entry.timestamp, timezone.get_current_timezone()
+        )
 
     @property
     def data(self) -> Dict[str, Any]:
@@ -158,11 +308,10 @@ class LogEntrySerializer:
         user_payload: Dict[str, Any] | None = None
         if entry.user_id:
             user = entry.user
-            user_payload = {
-                "id": entry.user_id,
-                "username": user.get_username() if user else None,
-                "email": getattr(user, "email", None) if user else None,
-            }
+            user_payload = {"id": entry.user_id, "username": None, "email": None}
+            if user is not None:
+                user_payload["username"] = getattr(user, user.USERNAME_FIELD)
+                user_payload["email"] = user.email
 
         return {
             "id": entry.pk,
@@ -2,10 +2,14 @@
 from __future__ import annotations
 
 import os
-from typing import Final
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final, Mapping
 
 from celery.schedules import crontab
 
+_TRUTHY_VALUES: Final[frozenset[str]] = frozenset({"1", "true", "yes", "on"})
+
 
 def _get_env_bool(name: str, default: bool = False) -> bool:
     """Return a boolean representation for an environment variable."""
@@ -13,7 +17,7 @@ def _get_env_bool(name: str, default: bool = False) -> bool:
     value = os.getenv(name)
     if value is None:
         return default
-    return value.lower() in {"1", "true", "yes", "on"}
+    return value.lower() in _TRUTHY_VALUES
 
 
 def _split_env_list(name: str) -> list[str]:
@@ -23,14 +27,11 @@ def _split_env_list(name: str) -> list[str]:
     return [item.strip() for item in raw_value.split(",") if item.strip()]
 
 
-def _parse_crontab(name: str, default_spec: str):
-    """Return a Celery crontab schedule from an env var."""
+@lru_cache(maxsize=32)
+def _crontab_from_spec(spec: str):
+    """Return a Celery crontab for a five-field spec, reusing parsed schedules."""
 
-    value = os.getenv(name, default_spec)
-    parts = value.split()
-    if len(parts) != 5:
-        parts = default_spec.split()
-    minute, hour, day_of_month, month_of_year, day_of_week = parts
+    minute, hour, day_of_month, month_of_year, day_of_week = spec.split()
     return crontab(
         minute=minute,
         hour=hour,
@@ -40,6 +41,17 @@ def _parse_crontab(name: str, default_spec: str):
     )
 
 
+def _parse_crontab(name: str, default_spec: str):
+    """Return a Celery crontab schedule from an env var."""
+
+    value = os.getenv(name, default_spec)
+    parts = value.split()
+    if len(parts) != 5:
+        parts = default_spec.split()
+    # Normalize whitespace so equivalent specs share one cached schedule.
+    return _crontab_from_spec(" ".join(parts))
+
+
 CELERY_BROKER_URL: Final[str] = os.getenv(
     "CELERY_BROKER_URL",
     os.getenv("REDIS_URL", "redis://127.0.0.1:6379/0"),
@@ -72,6 +84,25 @@ CELERY_TASK_ACKS_LATE: Final[bool] = _get_env_bool(
     "CELERY_TASK_ACKS_LATE",
     False,
 )
+CELERY_IO_BOUND_QUEUE: Final[str] = os.getenv(
+    "CELERY_IO_BOUND_QUEUE",
+    "io_bound",
+)
+# SMTP-bound email tasks run on a dedicated queue served by a gevent pool.
+# Certificate tasks stay on the prefork queue: PDF rendering is CPU-bound and
+# psycopg2 does not yield to gevent, so either would stall every greenlet.
+CELERY_TASK_ROUTES: Final[dict[str, dict[str, str]]] = {
+    task_name: {"queue": CELERY_IO_BOUND_QUEUE}
+    for task_name in (
+        "consultant_app.send_confirmation_email",
+        "consultant_app.send_confirmation_emails_batch",
+    )
+}
+# Long-running certificate tasks acknowledge late, so each worker process
+# should only reserve the message it is working on.
+CELERY_WORKER_PREFETCH_MULTIPLIER: Final[int] = int(
+    os.getenv("CELERY_WORKER_PREFETCH_MULTIPLIER", "1")
+)
 CELERY_TASK_SOFT_TIME_LIMIT: Final[int] = int(
     os.getenv("CELERY_TASK_SOFT_TIME_LIMIT", "60")
 )
@@ -94,7 +125,7 @@ ADMIN_REPORT_ATTACHMENT_PREFIX: Final[str] = os.getenv(
     "ADMIN_REPORT_ATTACHMENT_PREFIX",
     "consultant-analytics",
 )
-ADMIN_REPORT_SUBJECTS: Final[dict[str, str]] = {
+ADMIN_REPORT_SUBJECTS: Final[Mapping[str, str]] = MappingProxyType({
     "weekly": os.getenv(
         "ADMIN_REPORT_WEEKLY_SUBJECT",
         "Weekly consultant analytics report",
@@ -107,7 +138,7 @@ ADMIN_REPORT_SUBJECTS: Final[dict[str, str]] = {
         "ADMIN_REPORT_MANUAL_SUBJECT",
         "Consultant analytics report",
     ),
-}
+})
 
 ADMIN_REPORT_WEEKLY_SCHEDULE = _parse_crontab(
     "ADMIN_REPORT_WEEKLY_CRON", "0 6 * * MON"
@@ -136,6 +167,9 @@ __all__ = [
     "CELERY_TASK_ALWAYS_EAGER",
     "CELERY_TASK_EAGER_PROPAGATES",
     "CELERY_TASK_ACKS_LATE",
+    "CELERY_IO_BOUND_QUEUE",
+    "CELERY_TASK_ROUTES",
+    "CELERY_WORKER_PREFETCH_MULTIPLIER",
     "CELERY_TASK_SOFT_TIME_LIMIT",
     "CELERY_TASK_TIME_LIMIT",
     "ADMIN_REPORT_RECIPIENTS",
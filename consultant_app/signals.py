@@ -1,14 +1,101 @@
 """Custom signals for consultant certificate notifications."""
 from __future__ import annotations
 
-from typing import Any, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Iterator, Mapping
 
 from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connections, router, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import Signal, receiver
+from django.utils import timezone
 
 
 certificate_notification_dispatched = Signal()
 
+#: Cache key for the admin report recipients resolved from user accounts.
+ADMIN_REPORT_RECIPIENTS_CACHE_KEY = "consultant_app.admin_report.recipients"
+
+#: User columns that decide whether an account receives the admin report.
+_REPORT_RECIPIENT_FIELDS = frozenset({"email", "is_active", "is_staff", "is_superuser"})
+
+_pending_log_entries: ContextVar[list | None] = ContextVar(
+    "certificate_notification_log_entries", default=None
+)
+
+
+@lru_cache(maxsize=None)
+def _log_entry_model():
+    """Return the ``LogEntry`` model, looked up once the registry is ready."""
+
+    return apps.get_model("consultants", "LogEntry")
+
+
+#: Buffered batches larger than this skip model instantiation on flush.
+_RAW_INSERT_THRESHOLD = 200
+_LOG_ENTRY_COLUMNS = ("timestamp", "logger_name", "level", "message", "user", "context")
+
+
+def _insert_log_rows(rows: list[dict[str, Any]]) -> None:
+    """Insert buffered log entry values, using ``executemany`` for large batches."""
+
+    LogEntry = _log_entry_model()
+
+    if len(rows) <= _RAW_INSERT_THRESHOLD:
+        LogEntry.objects.bulk_create(
+            [LogEntry(**row) for row in rows], batch_size=500
+        )
+        return
+
+    connection = connections[router.db_for_write(LogEntry)]
+    fields = [LogEntry._meta.get_field(name) for name in _LOG_ENTRY_COLUMNS]
+    quote = connection.ops.quote_name
+    sql = "INSERT INTO {} ({}) VALUES ({})".format(
+        quote(LogEntry._meta.db_table),
+        ", ".join(quote(field.column) for field in fields),
+        ", ".join(["%s"] * len(fields)),
+    )
+    timestamp = timezone.now()
+    params = [
+        [
+            field.get_db_prep_save(
+                timestamp if field.name == "timestamp" else row.get(field.attname),
+                connection,
+            )
+            for field in fields
+        ]
+        for row in rows
+    ]
+    with transaction.atomic(using=connection.alias, savepoint=False):
+        with connection.cursor() as cursor:
+            cursor.executemany(sql, params)
+
+
+@contextmanager
+def batched_notification_logs() -> Iterator[None]:
+    """Buffer notification log entries and insert them together on exit.
+
+    Nested uses share the outermost buffer. Usable as a decorator as well.
+    """
+
+    if _pending_log_entries.get() is not None:
+        yield
+        return
+
+    buffer: list = []
+    token = _pending_log_entries.set(buffer)
+    try:
+        yield
+    finally:
+        _pending_log_entries.reset(token)
+        if buffer:
+            _insert_log_rows(buffer)
+
 
 @receiver(certificate_notification_dispatched)
 def record_certificate_notification_log(
@@ -27,8 +114,6 @@ def record_certificate_notification_log(
 ) -> None:
     """Persist a log entry for certificate notification activity."""
 
-    LogEntry = apps.get_model("consultants", "LogEntry")
-
     context: dict[str, Any] = {
         "action": f"certificate.notification.{event}",
         "channel": channel,
@@ -49,13 +134,47 @@ def record_certificate_notification_log(
         f"{channel.upper()} notification for certificate {event} {status}".strip()
     )
 
-    LogEntry.objects.create(
-        logger_name="consultant_app.notifications",
-        level=level,
-        message=message,
-        user_id=actor_id,
-        context=context,
-    )
+    row = {
+        "logger_name": "consultant_app.notifications",
+        "level": level,
+        "message": message,
+        "user_id": actor_id,
+        "context": context,
+    }
+
+    buffer = _pending_log_entries.get()
+    if buffer is not None:
+        buffer.append(row)
+    else:
+        _log_entry_model().objects.create(**row)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def forget_admin_report_recipients(
+    *, update_fields: frozenset[str] | None = None, **kwargs: Any
+) -> None:
+    """Drop cached report recipients when a relevant account field changes.
+
+    Partial saves that leave recipient fields alone, such as the
+    ``last_login`` update on every login, keep the cache.
+    """
+
+    if update_fields is not None and update_fields.isdisjoint(
+        _REPORT_RECIPIENT_FIELDS
+    ):
+        return
+    cache.delete(ADMIN_REPORT_RECIPIENTS_CACHE_KEY)
+
+
+@receiver(m2m_changed)
+def forget_admin_report_recipients_on_group_change(
+    sender: type, *, action: str, **kwargs: Any
+) -> None:
+    """Drop cached report recipients when group membership changes."""
+
+    if action.startswith("post_") and sender is get_user_model().groups.through:
+        cache.delete(ADMIN_REPORT_RECIPIENTS_CACHE_KEY)
 
 
-__all__ = ["certificate_notification_dispatched"]
+__all__ = ["batched_notification_logs", "certificate_notification_dispatched"]
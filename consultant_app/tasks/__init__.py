@@ -1,19 +1,38 @@
 """Celery tasks for the simplified consultant application."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Mapping
+import logging
+from functools import lru_cache, partial, singledispatch
+from typing import Any, Iterable, Mapping
 
 from celery import Celery, shared_task
+from celery.signals import task_postrun, task_prerun
 from celery.utils.log import get_task_logger
 from django.apps import apps
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.files.base import ContentFile
-from django.db import transaction
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.core.mail import get_connection
+from django.db import close_old_connections, transaction
+from django.db.models import Case, Q, Value, When
+from django.db.models.functions import Lower
 from django.utils import timezone
 
+from apps.consultants.models import Consultant
 from consultant_app import settings as consultant_settings
+from consultant_app.certificates import (
+    build_certificate_token,
+    build_verification_url,
+    render_certificate_pdf,
+    render_certificates_batch,
+    update_certificate_status,
+)
+
+from .notifications import (
+    send_certificate_notification,
+    send_certificate_notifications_bulk,
+)
 
 celery_app = Celery("consultant_app")
 celery_app.config_from_object("django.conf:settings", namespace="CELERY")
@@ -22,53 +41,160 @@ celery_app.conf.update(
     task_default_queue=consultant_settings.CELERY_TASK_DEFAULT_QUEUE,
     task_default_exchange=consultant_settings.CELERY_TASK_DEFAULT_EXCHANGE,
     task_default_routing_key=consultant_settings.CELERY_TASK_DEFAULT_ROUTING_KEY,
+    task_routes=consultant_settings.CELERY_TASK_ROUTES,
+    worker_prefetch_multiplier=consultant_settings.CELERY_WORKER_PREFETCH_MULTIPLIER,
 )
 celery_app.set_default()
 
+
+@task_prerun.connect
+@task_postrun.connect
+def _close_stale_connections(task=None, **kwargs: Any) -> None:
+    """Drop unusable or expired DB connections around each task.
+
+    Celery runs outside Django's request cycle, so nothing else enforces
+    ``CONN_MAX_AGE`` for worker connections. Eager tasks share the caller's
+    connection and transaction, so they are left alone.
+    """
+
+    if task is not None and getattr(task.request, "is_eager", False):
+        return
+    close_old_connections()
+
+
 logger = get_task_logger(__name__)
 
 
-@dataclass(frozen=True)
-class _TaskContext:
-    """Structured metadata describing the asynchronous execution."""
+def _task_context(
+    task, metadata: Mapping[str, Any] | None = None
+) -> dict[str, Any]:
+    """Return structured metadata describing the asynchronous execution."""
+
+    return {
+        "source": "celery",
+        "task_id": getattr(task.request, "id", None),
+        "task_name": task.name,
+        **(metadata or {}),
+    }
+
+
+@lru_cache(maxsize=None)
+def _certificate_model():
+    """Return the ``Certificate`` model, resolved once per worker process."""
+
+    return apps.get_model("consultant_app", "Certificate")
+
 
-    source: str
-    task_id: str | None
-    task_name: str
-    extra: Mapping[str, Any] | None = None
+@lru_cache(maxsize=None)
+def _notification_model():
+    """Return the ``Notification`` model, resolved once per worker process."""
 
-    def as_dict(self) -> dict[str, Any]:
-        payload = {
-            "source": self.source,
-            "task_id": self.task_id,
-            "task_name": self.task_name,
-        }
-        if self.extra:
-            payload.update(dict(self.extra))
-        return payload
+    return apps.get_model("consultants", "Notification")
 
 
+@singledispatch
 def _resolve_consultant(identifier: Any):
     """Resolve a consultant either by primary key or email address."""
 
-    from apps.consultants.models import Consultant
+    raise Consultant.DoesNotExist  # type: ignore[misc]
 
-    queryset = Consultant.objects.select_related("user")
 
-    if isinstance(identifier, int):
-        return queryset.get(pk=identifier)
+@_resolve_consultant.register
+def _(identifier: int):
+    return Consultant.objects.select_related("user").get(pk=identifier)
+
+
+@_resolve_consultant.register
+def _(identifier: str):
+    candidate = identifier.strip()
+    if candidate.isdigit():
+        return _resolve_consultant(int(candidate))
+    if "@" not in candidate:
+        raise Consultant.DoesNotExist  # type: ignore[misc]
+
+    # Match either address in one query, preferring the consultant's own.
+    consultant = (
+        Consultant.objects.select_related("user")
+        .filter(Q(email__iexact=candidate) | Q(user__email__iexact=candidate))
+        .order_by(
+            Case(
+                When(email__iexact=candidate, then=Value(0)),
+                default=Value(1),
+            ),
+            "pk",
+        )
+        .first()
+    )
+    if consultant is None:
+        raise Consultant.DoesNotExist  # type: ignore[misc]
+    return consultant
+
+
+@_resolve_consultant.register
+def _(identifier: bytes):
+    return _resolve_consultant(identifier.decode("utf-8", errors="replace"))
+
+
+def _resolve_consultants(identifiers: Iterable[Any]) -> dict[Any, Any]:
+    """Resolve many consultant identifiers with a single query.
+
+    Identifiers follow the same rules as :func:`_resolve_consultant`;
+    those that match no consultant are left out of the returned mapping.
+    """
+
+    lookups: dict[Any, tuple[str, Any]] = {}
+    for identifier in identifiers:
+        if isinstance(identifier, int) and not isinstance(identifier, bool):
+            lookups[identifier] = ("pk", identifier)
+        elif isinstance(identifier, str):
+            candidate = identifier.strip()
+            if candidate.isdigit():
+                lookups[identifier] = ("pk", int(candidate))
+            elif "@" in candidate:
+                lookups[identifier] = ("email", candidate.lower())
+
+    pks = {value for kind, value in lookups.values() if kind == "pk"}
+    emails = {value for kind, value in lookups.values() if kind == "email"}
+    if not pks and not emails:
+        return {}
+
+    consultants = (
+        Consultant.objects.select_related("user")
+        .annotate(
+            email_lower=Lower("email"),
+            user_email_lower=Lower("user__email"),
+        )
+        .filter(
+            Q(pk__in=pks)
+            | Q(email_lower__in=emails)
+            | Q(user_email_lower__in=emails)
+        )
+        .order_by("pk")
+    )
 
-    if isinstance(identifier, str):
-        candidate = identifier.strip()
-        if candidate.isdigit():
-            return queryset.get(pk=int(candidate))
-        if "@" in candidate:
-            try:
-                return queryset.get(email__iexact=candidate)
-            except Consultant.DoesNotExist:
-                return queryset.get(user__email__iexact=candidate)
+    by_pk: dict[int, Any] = {}
+    by_email: dict[str, Any] = {}
+    by_user_email: dict[str, Any] = {}
+    for consultant in consultants:
+        by_pk[consultant.pk] = consultant
+        if consultant.email_lower:
+            by_email.setdefault(consultant.email_lower, consultant)
+        if consultant.user_email_lower:
+            by_user_email.setdefault(consultant.user_email_lower, consultant)
+
+    resolved: dict[Any, Any] = {}
+    for identifier, (kind, value) in lookups.items():
+        if kind == "pk":
+            consultant = by_pk.get(value)
+        else:
+            # Prefer the consultant's own address, as _resolve_consultant does.
+            consultant = by_email.get(value) or by_user_email.get(value)
+        if consultant is not None:
+            resolved[identifier] = consultant
+    return resolved
 
-    raise Consultant.DoesNotExist  # type: ignore[misc]
+
+_ACTOR_FIELDS = ("pk", "first_name", "last_name", "username", "email")
 
 
 def _resolve_actor(actor_id: int | None):
@@ -78,7 +204,12 @@ def _resolve_actor(actor_id: int | None):
         return None
 
     UserModel = get_user_model()
-    return UserModel.objects.filter(pk=actor_id).first()
+    # Tasks only read the actor's pk and the fields used by _actor_display.
+    return (
+        UserModel.objects.only(*_ACTOR_FIELDS)
+        .filter(pk=actor_id)
+        .first()
+    )
 
 
 def _actor_display(actor) -> str | None:
@@ -107,33 +238,41 @@ def _actor_display(actor) -> str | None:
 def _notify_consultant(consultant, message: str, *, context: dict[str, Any]) -> None:
     """Persist an in-app notification for the consultant."""
 
-    Notification = apps.get_model("consultants", "Notification")
+    Notification = _notification_model()
     if not consultant.user_id:
-        logger.debug(
-            "Skipping notification dispatch because consultant has no user account.",
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Skipping notification dispatch because consultant has no user "
+                "account.",
+                extra={
+                    "consultant_id": consultant.pk,
+                    "context": context,
+                },
+            )
+        return
+
+    # Notification has no save() override or save signals to honour.
+    (notification,) = Notification.objects.bulk_create(
+        [
+            Notification(
+                recipient=consultant.user,
+                notification_type=Notification.NotificationType.COMMENT,
+                message=message,
+            )
+        ]
+    )
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Notification %s dispatched for consultant %s",
+            notification.pk,
+            consultant.pk,
             extra={
                 "consultant_id": consultant.pk,
+                "notification_id": notification.pk,
                 "context": context,
             },
         )
-        return
-
-    notification = Notification.objects.create(
-        recipient=consultant.user,
-        notification_type=Notification.NotificationType.COMMENT,
-        message=message,
-    )
-
-    logger.info(
-        "Notification %s dispatched for consultant %s",
-        notification.pk,
-        consultant.pk,
-        extra={
-            "consultant_id": consultant.pk,
-            "notification_id": notification.pk,
-            "context": context,
-        },
-    )
 
 
 @shared_task(
@@ -148,7 +287,6 @@ def send_confirmation_email(self, consultant_identifier: Any) -> None:
     """Send the consultant submission confirmation email."""
 
     from apps.consultants.emails import send_submission_confirmation_email
-    from apps.consultants.models import Consultant
 
     try:
         consultant = _resolve_consultant(consultant_identifier)
@@ -165,19 +303,20 @@ def send_confirmation_email(self, consultant_identifier: Any) -> None:
         )
         return None
 
-    logger.info(
-        "Dispatching confirmation email for consultant %s",
-        consultant.pk,
-        extra={
-            "consultant_id": consultant.pk,
-            "user_id": consultant.user_id,
-            "context": {
-                "action": "consultant_app.confirmation_email.dispatch",
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Dispatching confirmation email for consultant %s",
+            consultant.pk,
+            extra={
                 "consultant_id": consultant.pk,
                 "user_id": consultant.user_id,
+                "context": {
+                    "action": "consultant_app.confirmation_email.dispatch",
+                    "consultant_id": consultant.pk,
+                    "user_id": consultant.user_id,
+                },
             },
-        },
-    )
+        )
 
     try:
         send_submission_confirmation_email(consultant)
@@ -197,24 +336,115 @@ def send_confirmation_email(self, consultant_identifier: Any) -> None:
         )
         raise
 
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Sent confirmation email for consultant %s",
+            consultant.pk,
+            extra={
+                "consultant_id": consultant.pk,
+                "user_id": consultant.user_id,
+                "context": {
+                    "action": "consultant_app.confirmation_email.sent",
+                    "consultant_id": consultant.pk,
+                    "user_id": consultant.user_id,
+                },
+            },
+        )
+
+
+@shared_task(name="consultant_app.send_confirmation_emails_batch")
+def send_confirmation_emails_batch(
+    consultant_identifiers: list[Any],
+) -> dict[str, list[Any]]:
+    """Send confirmation emails for many consultants from one task.
+
+    Consultants are resolved with a single query and every email goes out
+    over one mail connection, so the SMTP handshake is paid once per batch.
+    Failures are collected per identifier so one bad row does not abort the
+    rest of the batch.
+    """
+
+    from apps.consultants.emails import send_submission_confirmation_email
+
+    resolved = _resolve_consultants(consultant_identifiers)
+    summary: dict[str, list[Any]] = {"sent": [], "missing": [], "failed": []}
+
+    with get_connection() as connection:
+        for identifier in consultant_identifiers:
+            consultant = resolved.get(identifier)
+            if consultant is None:
+                summary["missing"].append(identifier)
+                continue
+
+            try:
+                send_submission_confirmation_email(consultant, connection=connection)
+            except Exception:
+                logger.exception(
+                    "Failed to send confirmation email for consultant %s",
+                    consultant.pk,
+                    extra={
+                        "consultant_id": consultant.pk,
+                        "user_id": consultant.user_id,
+                        "context": {
+                            "action": "consultant_app.confirmation_email.error",
+                            "consultant_id": consultant.pk,
+                            "user_id": consultant.user_id,
+                        },
+                    },
+                )
+                summary["failed"].append(identifier)
+            else:
+                summary["sent"].append(identifier)
+
     logger.info(
-        "Sent confirmation email for consultant %s",
-        consultant.pk,
+        "Sent %s of %s confirmation emails",
+        len(summary["sent"]),
+        len(consultant_identifiers),
         extra={
-            "consultant_id": consultant.pk,
-            "user_id": consultant.user_id,
             "context": {
-                "action": "consultant_app.confirmation_email.sent",
-                "consultant_id": consultant.pk,
-                "user_id": consultant.user_id,
+                "action": "consultant_app.confirmation_email.batch",
+                "missing": summary["missing"],
+                "failed": summary["failed"],
             },
         },
     )
+    return summary
+
+
+@shared_task(
+    name="consultant_app.delete_storage_file",
+    acks_late=True,
+    reject_on_worker_lost=True,
+    autoretry_for=(ConnectionError, TimeoutError),
+    retry_backoff=5,
+    retry_jitter=True,
+    retry_kwargs={"max_retries": 5},
+)
+def delete_storage_file_task(name: str) -> None:
+    """Delete a superseded media file; missing files are ignored."""
+
+    default_storage.delete(name)
+
+
+def _discard_stored_file(name: str | None, *, current: str | None) -> None:
+    """Queue deletion of a replaced file once the current transaction commits.
+
+    The old file still exists when its replacement is saved under the same
+    deterministic name, so ``FileSystemStorage`` gives each new PDF a random
+    suffix (``approval-certificate-1_AbC123x.pdf``). Storages that overwrite
+    in place return the old name instead; ``current`` guards against
+    deleting the file that was just written.
+    """
+
+    if name and name != current:
+        transaction.on_commit(partial(delete_storage_file_task.delay, name))
 
 
 @shared_task(
     bind=True,
     name="consultant_app.certificate_revoke",
+    acks_late=True,
+    reject_on_worker_lost=True,
     autoretry_for=(TimeoutError,),
     retry_backoff=5,
     retry_jitter=True,
@@ -231,8 +461,6 @@ def revoke_certificate_task(
 ) -> None:
     """Revoke the consultant's active certificate and notify stakeholders."""
 
-    from apps.consultants.models import Consultant
-
     try:
         consultant = _resolve_consultant(consultant_identifier)
     except Consultant.DoesNotExist:
@@ -250,15 +478,9 @@ def revoke_certificate_task(
         return
 
     actor = _resolve_actor(actor_id)
-    task_context = _TaskContext(
-        source="celery",
-        task_id=getattr(self.request, "id", None),
-        task_name=self.name,
-        extra=metadata,
-    ).as_dict()
+    task_context = _task_context(self, metadata)
 
-    from consultant_app.certificates import update_certificate_status
-    CertificateModel = apps.get_model("consultant_app", "Certificate")
+    CertificateModel = _certificate_model()
 
     with transaction.atomic():
         certificate = update_certificate_status(
@@ -299,8 +521,6 @@ def revoke_certificate_task(
                     "certificate_id": certificate.pk,
                 },
             )
-            from .notifications import send_certificate_notification
-
             send_certificate_notification.delay(
                 consultant.pk,
                 event="revoked",
@@ -313,26 +533,109 @@ def revoke_certificate_task(
                 },
             )
 
-        logger.info(
-            "Certificate %s for consultant %s revoked via task",
-            certificate.pk,
-            consultant.pk,
-            extra={
-                "consultant_id": consultant.pk,
-                "certificate_id": certificate.pk,
-                "user_id": getattr(actor, "pk", None),
-                "context": {
-                    **task_context,
-                    "action": "certificate.revoke.completed",
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Certificate %s for consultant %s revoked via task",
+                certificate.pk,
+                consultant.pk,
+                extra={
+                    "consultant_id": consultant.pk,
                     "certificate_id": certificate.pk,
+                    "user_id": getattr(actor, "pk", None),
+                    "context": {
+                        **task_context,
+                        "action": "certificate.revoke.completed",
+                        "certificate_id": certificate.pk,
+                    },
                 },
-            },
+            )
+
+
+def _attach_certificate_pdf(
+    consultant: Consultant,
+    pdf_stream: Any,
+    *,
+    issued_at: Any,
+    **fields: Any,
+) -> bool:
+    """Store a rendered PDF and point the consultant at it.
+
+    The PDF is only attached while ``issued_at`` is still the consultant's
+    current issue; if a reissue committed during rendering, the stale file
+    is discarded instead and ``False`` is returned.
+    """
+
+    pdf_field = Consultant._meta.get_field("certificate_pdf")
+    previous_pdf_name = consultant.certificate_pdf.name
+    stored_name = pdf_field.storage.save(
+        pdf_field.generate_filename(
+            consultant, f"approval-certificate-{consultant.pk}.pdf"
+        ),
+        File(pdf_stream),
+        max_length=pdf_field.max_length,
+    )
+
+    attached = Consultant.objects.filter(
+        pk=consultant.pk, certificate_generated_at=issued_at
+    ).update(certificate_pdf=stored_name, **fields)
+    if not attached:
+        _discard_stored_file(
+            stored_name,
+            current=Consultant.objects.filter(pk=consultant.pk)
+            .values_list("certificate_pdf", flat=True)
+            .first(),
+        )
+        return False
+
+    consultant.certificate_pdf = stored_name
+    for name, value in fields.items():
+        setattr(consultant, name, value)
+    _discard_stored_file(previous_pdf_name, current=stored_name)
+    return True
+
+
+def _is_retry(request: Any) -> bool:
+    """Return ``True`` when the task request is a retry or a redelivery."""
+
+    delivery_info = getattr(request, "delivery_info", None) or {}
+    return bool(
+        getattr(request, "retries", 0) or delivery_info.get("redelivered")
+    )
+
+
+def _committed_reissue(consultant: Consultant) -> tuple[Any, Any] | None:
+    """Return ``(previous, fresh)`` when a reissue already committed.
+
+    A retried reissue uses this to resume at the render step instead of
+    reissuing the replacement certificate again.
+    """
+
+    issued_at = consultant.certificate_generated_at
+    if issued_at is None:
+        return None
+
+    CertificateModel = _certificate_model()
+    records = {
+        record.status: record
+        for record in CertificateModel.objects.filter(consultant=consultant)
+        .filter(
+            Q(status=CertificateModel.Status.VALID, issued_at=issued_at)
+            | Q(status=CertificateModel.Status.REISSUED, reissued_at=issued_at)
         )
+        .order_by("pk")
+    }
+    previous = records.get(CertificateModel.Status.REISSUED)
+    fresh = records.get(CertificateModel.Status.VALID)
+    if previous is None or fresh is None:
+        return None
+    return previous, fresh
 
 
 @shared_task(
     bind=True,
     name="consultant_app.certificate_reissue",
+    acks_late=True,
+    reject_on_worker_lost=True,
     autoretry_for=(TimeoutError,),
     retry_backoff=5,
     retry_jitter=True,
@@ -349,8 +652,6 @@ def reissue_certificate_task(
 ) -> None:
     """Reissue an approval certificate, replacing the active signed token."""
 
-    from apps.consultants.models import Consultant
-
     try:
         consultant = _resolve_consultant(consultant_identifier)
     except Consultant.DoesNotExist:
@@ -368,106 +669,112 @@ def reissue_certificate_task(
         return
 
     actor = _resolve_actor(actor_id)
-    task_context = _TaskContext(
-        source="celery",
-        task_id=getattr(self.request, "id", None),
-        task_name=self.name,
-        extra=metadata,
-    ).as_dict()
-
-    from consultant_app.certificates import (
-        build_verification_url,
-        render_certificate_pdf,
-        update_certificate_status,
-    )
-    CertificateModel = apps.get_model("consultant_app", "Certificate")
+    task_context = _task_context(self, metadata)
+
+    CertificateModel = _certificate_model()
 
     with transaction.atomic():
-        transition_time = timezone.now()
-        current_certificate = update_certificate_status(
-            consultant,
-            status=CertificateModel.Status.REISSUED,
-            user=actor,
-            reason=reason,
-            timestamp=transition_time,
-            context=task_context,
+        # Serialize concurrent reissues for the same consultant; only the
+        # consultant row is locked, not the joined user.
+        consultant = (
+            Consultant.objects.select_for_update(of=("self",))
+            .select_related("user")
+            .get(pk=consultant.pk)
         )
+        resumed = None
+        if _is_retry(self.request):
+            resumed = _committed_reissue(consultant)
+        if resumed is not None:
+            # A previous attempt committed the reissue but failed while
+            # rendering; only the PDF still needs to be produced.
+            current_certificate, fresh_certificate = resumed
+            now = fresh_certificate.issued_at
+        else:
+            # One timestamp for the whole reissue keeps the reissued, issued,
+            # valid and generated times consistent with each other.
+            now = timezone.now()
+            current_certificate = update_certificate_status(
+                consultant,
+                status=CertificateModel.Status.REISSUED,
+                user=actor,
+                reason=reason,
+                timestamp=now,
+                context=task_context,
+            )
 
-        if current_certificate is None:
-            logger.warning(
-                "No certificate available to reissue for consultant %s",
-                consultant.pk,
-                extra={
-                    "consultant_id": consultant.pk,
-                    "user_id": getattr(actor, "pk", None),
-                    "context": {
-                        **task_context,
-                        "action": "certificate.reissue.missing_certificate",
+            if current_certificate is None:
+                logger.warning(
+                    "No certificate available to reissue for consultant %s",
+                    consultant.pk,
+                    extra={
+                        "consultant_id": consultant.pk,
+                        "user_id": getattr(actor, "pk", None),
+                        "context": {
+                            **task_context,
+                            "action": "certificate.reissue.missing_certificate",
+                        },
                     },
-                },
+                )
+                return
+
+            fresh_certificate = CertificateModel.objects.create(
+                consultant=consultant,
+                status=CertificateModel.Status.VALID,
+                issued_at=now,
+                status_set_at=now,
+                valid_at=now,
+                status_reason="",
             )
-            return
-
-        fresh_issue_timestamp = timezone.now()
-        fresh_certificate = CertificateModel.objects.create(
-            consultant=consultant,
-            status=CertificateModel.Status.VALID,
-            issued_at=fresh_issue_timestamp,
-            status_set_at=fresh_issue_timestamp,
-            valid_at=fresh_issue_timestamp,
-            status_reason="",
-        )
-
-        consultant.certificate_generated_at = fresh_issue_timestamp
+            # Point the consultant at the new certificate while the row is
+            # still locked so a slower concurrent reissue cannot overwrite it.
+            Consultant.objects.filter(pk=consultant.pk).update(
+                certificate_generated_at=now,
+                updated_at=now,
+            )
+            consultant.certificate_generated_at = now
+            consultant.updated_at = now
+
+    # Render and store the PDF outside the transaction so row locks are not
+    # held across rendering and storage latency.
+    verification_url = build_verification_url(consultant)
+    issued_on = timezone.localtime(now).date()
+    generated_by = _actor_display(actor)
+    pdf_stream = render_certificate_pdf(
+        consultant,
+        issued_at=issued_on,
+        verification_url=verification_url,
+        generated_by=generated_by,
+    )
 
-        if consultant.certificate_pdf:
-            consultant.certificate_pdf.delete(save=False)
+    _attach_certificate_pdf(consultant, pdf_stream, issued_at=now)
 
-        verification_url = build_verification_url(consultant)
-        issued_on = timezone.localtime(fresh_issue_timestamp).date()
-        generated_by = _actor_display(actor)
-        pdf_stream = render_certificate_pdf(
+    if notify_consultant:
+        message = (
+            "Your consultant certificate has been reissued with updated details."
+            + (f" Reason: {reason}" if reason else "")
+        )
+        _notify_consultant(
             consultant,
-            issued_at=issued_on,
-            verification_url=verification_url,
-            generated_by=generated_by,
+            message,
+            context={
+                **task_context,
+                "action": "certificate.reissue.notification",
+                "certificate_id": fresh_certificate.pk,
+            },
         )
-
-        pdf_content = ContentFile(pdf_stream.getvalue())
-        filename = f"approval-certificate-{consultant.pk}.pdf"
-        consultant.certificate_pdf.save(filename, pdf_content, save=False)
-        consultant.save(
-            update_fields=["certificate_pdf", "certificate_generated_at", "updated_at"],
+        send_certificate_notification.delay(
+            consultant.pk,
+            event="reissued",
+            certificate_id=fresh_certificate.pk,
+            reason=reason,
+            actor_id=getattr(actor, "pk", None),
+            metadata={
+                **task_context,
+                "action": "certificate.reissue.notification",
+            },
         )
 
-        if notify_consultant:
-            message = (
-                "Your consultant certificate has been reissued with updated details."
-                + (f" Reason: {reason}" if reason else "")
-            )
-            _notify_consultant(
-                consultant,
-                message,
-                context={
-                    **task_context,
-                    "action": "certificate.reissue.notification",
-                    "certificate_id": fresh_certificate.pk,
-                },
-            )
-            from .notifications import send_certificate_notification
-
-            send_certificate_notification.delay(
-                consultant.pk,
-                event="reissued",
-                certificate_id=fresh_certificate.pk,
-                reason=reason,
-                actor_id=getattr(actor, "pk", None),
-                metadata={
-                    **task_context,
-                    "action": "certificate.reissue.notification",
-                },
-            )
-
+    if logger.isEnabledFor(logging.INFO):
         logger.info(
             "Issued replacement certificate %s for consultant %s",
             fresh_certificate.pk,
@@ -486,13 +793,85 @@ def reissue_certificate_task(
         )
 
 
-from .notifications import send_certificate_notification
+@shared_task(
+    bind=True,
+    name="consultant_app.certificate_render_batch",
+    autoretry_for=(TimeoutError,),
+    retry_backoff=5,
+    retry_jitter=True,
+    retry_kwargs={"max_retries": 3},
+)
+def render_certificates_batch_task(
+    self,
+    consultant_ids: list[int],
+    *,
+    actor_id: int | None = None,
+) -> list[int]:
+    """Regenerate certificate PDFs for many consultants with one render pass."""
+
+    task_context = _task_context(self)
+
+    consultants = []
+    for consultant in Consultant.objects.filter(pk__in=consultant_ids).order_by("pk"):
+        try:
+            build_certificate_token(consultant)
+        except ValueError:
+            logger.warning(
+                "Skipping certificate render for consultant %s without an active certificate",
+                consultant.pk,
+                extra={
+                    "consultant_id": consultant.pk,
+                    "context": {
+                        **task_context,
+                        "action": "certificate.render_batch.skipped",
+                    },
+                },
+            )
+            continue
+        consultants.append(consultant)
+
+    actor = _resolve_actor(actor_id)
+    pdf_streams = render_certificates_batch(
+        consultants,
+        generated_by=_actor_display(actor),
+    )
+
+    # ``certificate_generated_at`` is as loaded above, so a reissue that
+    # commits while the batch renders keeps its own PDF.
+    rendered_ids = [
+        consultant.pk
+        for consultant, pdf_stream in zip(consultants, pdf_streams)
+        if _attach_certificate_pdf(
+            consultant,
+            pdf_stream,
+            issued_at=consultant.certificate_generated_at,
+            updated_at=timezone.now(),
+        )
+    ]
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Rendered %s certificate PDFs in one batch",
+            len(rendered_ids),
+            extra={
+                "user_id": getattr(actor, "pk", None),
+                "context": {
+                    **task_context,
+                    "action": "certificate.render_batch.completed",
+                    "consultant_ids": rendered_ids,
+                },
+            },
+        )
+    return rendered_ids
 
 
 __all__ = [
     "celery_app",
+    "delete_storage_file_task",
     "reissue_certificate_task",
+    "render_certificates_batch_task",
     "revoke_certificate_task",
     "send_certificate_notification",
+    "send_certificate_notifications_bulk",
     "send_confirmation_email",
+    "send_confirmation_emails_batch",
 ]
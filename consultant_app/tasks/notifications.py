@@ -4,21 +4,51 @@ from __future__ import annotations
 import base64
 import json
 import logging
-from typing import Any, Mapping
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from string import Formatter
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Mapping
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
+import urllib3
 from celery import shared_task
-from django.apps import apps
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import get_connection, send_mail
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.utils import timezone
 
+from apps.consultants.models import Consultant
 from consultant_app.certificates import build_verification_url
-from consultant_app.signals import certificate_notification_dispatched
+from consultant_app.models import Certificate
+from consultant_app.signals import (
+    batched_notification_logs,
+    certificate_notification_dispatched,
+)
 
 logger = logging.getLogger(__name__)
 
+#: Consultant columns read while building and delivering a notification,
+#: including those used by ``build_verification_url``. The primary key is
+#: always loaded.
+_CONSULTANT_FIELDS = (
+    "email",
+    "full_name",
+    "phone_number",
+    "certificate_generated_at",
+    "certificate_uuid",
+)
+_CERTIFICATE_FIELDS = (
+    *(field.name for field in Certificate._meta.concrete_fields),
+    *(f"consultant__{name}" for name in _CONSULTANT_FIELDS),
+)
+
+# One pool per worker process, shared by the bulk task's SMS threads, so
+# repeated SMS requests to the same host reuse their TCP/TLS connections.
+_SMS_POOL_SIZE = 10
+_HTTP = urllib3.PoolManager(maxsize=_SMS_POOL_SIZE, retries=False)
+
 DEFAULT_TEMPLATES: dict[str, dict[str, str]] = {
     "issued": {
         "email_subject": "Your consultant certificate has been issued",
@@ -76,7 +106,47 @@ class _SafeFormatDict(dict):
         return ""
 
 
+@lru_cache(maxsize=64)
+def _compile_template(template: str) -> Callable[[Mapping[str, Any]], str]:
+    """Parse ``template`` once and return a function that renders it.
+
+    Missing keys render as empty strings. Templates using format specs,
+    conversions or attribute lookups fall back to ``str.format_map``.
+    """
+
+    parts: list[tuple[str, str | None]] = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        if spec or conversion or (field is not None and not field.isidentifier()):
+            return lambda context: template.format_map(_SafeFormatDict(context))
+        parts.append((literal, field))
+
+    def render(context: Mapping[str, Any]) -> str:
+        return "".join(
+            literal if field is None else f"{literal}{context.get(field, '')}"
+            for literal, field in parts
+        )
+
+    return render
+
+
+@lru_cache(maxsize=64)
+def _template_fields(template: str) -> frozenset[str]:
+    """Return the top-level context keys referenced by ``template``."""
+
+    return frozenset(
+        field.split(".", 1)[0].split("[", 1)[0]
+        for _, field, _, _ in Formatter().parse(template)
+        if field
+    )
+
+
+@lru_cache(maxsize=1)
 def _merge_templates() -> dict[str, dict[str, str]]:
+    """Return the default templates merged with settings overrides.
+
+    The result is built once per process and must be treated as read-only.
+    """
+
     custom = getattr(settings, "CERTIFICATE_NOTIFICATION_TEMPLATES", None) or {}
     merged: dict[str, dict[str, str]] = {
         key: value.copy() for key, value in DEFAULT_TEMPLATES.items()
@@ -87,10 +157,38 @@ def _merge_templates() -> dict[str, dict[str, str]]:
     return merged
 
 
+_MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+
 def _format_datetime(value) -> str:
     if not value:
         return ""
-    return timezone.localtime(value).strftime("%d %B %Y")
+    return _format_local_date(value, timezone.get_current_timezone())
+
+
+@lru_cache(maxsize=256)
+def _format_local_date(value, tz) -> str:
+    """Render ``value`` as e.g. ``05 March 2025`` in ``tz``.
+
+    The timezone is an argument so ``timezone.activate`` still applies;
+    equal aware datetimes are the same instant and render identically.
+    """
+
+    local = timezone.localtime(value, tz)
+    return f"{local.day:02d} {_MONTH_NAMES[local.month - 1]} {local.year}"
 
 
 def _build_context(
@@ -99,6 +197,7 @@ def _build_context(
     *,
     event: str,
     reason: str,
+    include_verification_url: bool = True,
 ) -> dict[str, Any]:
     issued_source = None
     if certificate and certificate.issued_at:
@@ -111,7 +210,7 @@ def _build_context(
         status_time = certificate.status_set_at
 
     verification_url = ""
-    if event in {"issued", "reissued"}:
+    if include_verification_url and event in {"issued", "reissued"}:
         try:
             verification_url = build_verification_url(consultant)
         except ValueError:
@@ -139,6 +238,7 @@ def _build_context(
     return context
 
 
+@lru_cache(maxsize=1)
 def _notification_from_email() -> str:
     if hasattr(settings, "CERTIFICATE_NOTIFICATION_FROM_EMAIL"):
         configured = getattr(settings, "CERTIFICATE_NOTIFICATION_FROM_EMAIL")
@@ -148,7 +248,14 @@ def _notification_from_email() -> str:
     return str(default or "no-reply@example.com")
 
 
-def _send_email(consultant, subject_template: str, body_template: str, context: dict[str, Any]) -> bool:
+def _send_email(
+    consultant,
+    subject_template: str,
+    body_template: str,
+    context: dict[str, Any],
+    *,
+    connection=None,
+) -> bool:
     if not consultant.email:
         logger.warning(
             "Consultant %s has no email address; skipping certificate notification email.",
@@ -160,9 +267,8 @@ def _send_email(consultant, subject_template: str, body_template: str, context:
     if not subject_template or not body_template:
         return False
 
-    formatter = _SafeFormatDict(context)
-    subject = subject_template.format_map(formatter).strip()
-    body = body_template.format_map(formatter).strip()
+    subject = _compile_template(subject_template)(context).strip()
+    body = _compile_template(body_template)(context).strip()
 
     if not subject or not body:
         return False
@@ -173,6 +279,7 @@ def _send_email(consultant, subject_template: str, body_template: str, context:
         _notification_from_email(),
         [consultant.email],
         fail_silently=False,
+        connection=connection,
     )
     return True
 
@@ -180,6 +287,11 @@ def _send_email(consultant, subject_template: str, body_template: str, context:
 def _should_send_sms(send_sms: bool | None) -> bool:
     if send_sms is not None:
         return bool(send_sms)
+    return _sms_enabled_by_default()
+
+
+@lru_cache(maxsize=1)
+def _sms_enabled_by_default() -> bool:
     if hasattr(settings, "CERTIFICATE_NOTIFICATION_ENABLE_SMS"):
         return bool(getattr(settings, "CERTIFICATE_NOTIFICATION_ENABLE_SMS"))
     twilio_configured = all(
@@ -190,18 +302,52 @@ def _should_send_sms(send_sms: bool | None) -> bool:
     return twilio_configured or gateway_configured
 
 
-def _twilio_request(account_sid: str, auth_token: str, from_number: str, to_number: str, body: str) -> None:
-    url = f"https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Messages.json"
-    payload = urlencode({"To": to_number, "From": from_number, "Body": body}).encode()
-    headers = {"Content-Type": "application/x-www-form-urlencoded"}
+def _post_sms_request(url: str, body: bytes, headers: Mapping[str, str]) -> None:
+    timeout = getattr(settings, "CERTIFICATE_NOTIFICATION_SMS_TIMEOUT", 10)
+    response = _HTTP.request("POST", url, body=body, headers=headers, timeout=timeout)
+    if response.status >= 400:
+        raise urllib3.exceptions.HTTPError(
+            f"SMS request to {url} failed with status {response.status}"
+        )
+
+
+# Settings-derived values above are computed once per process; overriding
+# any of these settings (as tests do) clears the matching cache.
+_SETTINGS_CACHES: dict[str, tuple[Callable[..., Any], ...]] = {
+    "CERTIFICATE_NOTIFICATION_TEMPLATES": (_merge_templates,),
+    "CERTIFICATE_NOTIFICATION_FROM_EMAIL": (_notification_from_email,),
+    "DEFAULT_FROM_EMAIL": (_notification_from_email,),
+    "CERTIFICATE_NOTIFICATION_ENABLE_SMS": (_sms_enabled_by_default,),
+    "TWILIO_ACCOUNT_SID": (_sms_enabled_by_default,),
+    "TWILIO_AUTH_TOKEN": (_sms_enabled_by_default,),
+    "TWILIO_FROM_NUMBER": (_sms_enabled_by_default,),
+    "CERTIFICATE_SMS_GATEWAY_URL": (_sms_enabled_by_default,),
+}
+
+
+@receiver(setting_changed)
+def _reset_settings_caches(*, setting: str, **kwargs: Any) -> None:
+    for cached in _SETTINGS_CACHES.get(setting, ()):
+        cached.cache_clear()
+
+
+@lru_cache(maxsize=4)
+def _twilio_headers(account_sid: str, auth_token: str) -> Mapping[str, str]:
+    """Return the Twilio request headers, built once per set of credentials."""
 
-    request = Request(url, data=payload, headers=headers)
     credentials = base64.b64encode(f"{account_sid}:{auth_token}".encode()).decode()
-    request.add_header("Authorization", f"Basic {credentials}")
+    return MappingProxyType(
+        {
+            "Content-Type": "application/x-www-form-urlencoded",
+            "Authorization": f"Basic {credentials}",
+        }
+    )
 
-    timeout = getattr(settings, "CERTIFICATE_NOTIFICATION_SMS_TIMEOUT", 10)
-    with urlopen(request, timeout=timeout) as response:  # nosec B310
-        response.read()
+
+def _twilio_request(account_sid: str, auth_token: str, from_number: str, to_number: str, body: str) -> None:
+    url = f"https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Messages.json"
+    payload = urlencode({"To": to_number, "From": from_number, "Body": body}).encode()
+    _post_sms_request(url, payload, _twilio_headers(account_sid, auth_token))
 
 
 def _gateway_request(url: str, to_number: str, body: str) -> None:
@@ -210,11 +356,7 @@ def _gateway_request(url: str, to_number: str, body: str) -> None:
     token = getattr(settings, "CERTIFICATE_SMS_GATEWAY_TOKEN", None)
     if token:
         headers["Authorization"] = f"Bearer {token}"
-
-    request = Request(url, data=payload, headers=headers)
-    timeout = getattr(settings, "CERTIFICATE_NOTIFICATION_SMS_TIMEOUT", 10)
-    with urlopen(request, timeout=timeout) as response:  # nosec B310
-        response.read()
+    _post_sms_request(url, payload, headers)
 
 
 def _dispatch_sms(phone_number: str, message: str) -> bool:
@@ -233,16 +375,61 @@ def _dispatch_sms(phone_number: str, message: str) -> bool:
     return False
 
 
-@shared_task(
-    bind=True,
-    name="consultant_app.send_certificate_notification",
-    autoretry_for=(NotificationDeliveryError,),
-    retry_backoff=10,
-    retry_jitter=True,
-    retry_kwargs={"max_retries": 5},
-)
-def send_certificate_notification(
-    self,
+def _report_sms(
+    status: str,
+    dispatch: Callable[[], bool] | None,
+    *,
+    consultant,
+    event_key: str,
+    certificate,
+    reason_text: str,
+    actor_id: int | None,
+    task_metadata: dict[str, Any],
+) -> str:
+    """Run ``dispatch`` if given, then log and signal the SMS outcome."""
+
+    error: Exception | None = None
+    if dispatch is not None:
+        log_extra = {
+            "consultant_id": consultant.pk,
+            "context": {**task_metadata, "channel": "sms", "reason": reason_text},
+        }
+        try:
+            status = "sent" if dispatch() else "disabled"
+        except Exception as exc:
+            status = "failed"
+            error = exc
+            logger.exception(
+                "Failed to send %s certificate SMS to consultant %s",
+                event_key,
+                consultant.pk,
+                extra=log_extra,
+            )
+        else:
+            if status == "sent" and logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Sent %s certificate SMS notification to consultant %s",
+                    event_key,
+                    consultant.pk,
+                    extra=log_extra,
+                )
+
+    certificate_notification_dispatched.send(
+        sender=send_certificate_notification,
+        consultant_id=consultant.pk,
+        event=event_key,
+        channel="sms",
+        status=status,
+        certificate_id=getattr(certificate, "pk", None),
+        reason=reason_text,
+        actor_id=actor_id,
+        metadata=task_metadata,
+        error=error,
+    )
+    return status
+
+
+def _deliver_certificate_notification(
     consultant_id: int,
     *,
     event: str,
@@ -251,8 +438,18 @@ def send_certificate_notification(
     actor_id: int | None = None,
     metadata: Mapping[str, Any] | None = None,
     send_sms: bool | None = None,
+    task_id: str | None = None,
+    connection=None,
+    sms_pool: Executor | None = None,
+    deferred_sms: list[Callable[[], str]] | None = None,
 ) -> dict[str, Any]:
-    """Send certificate lifecycle notifications to a consultant."""
+    """Notify one consultant.
+
+    ``connection`` lets callers share a mail connection. When ``sms_pool`` and
+    ``deferred_sms`` are given, the SMS is submitted to the pool and a callable
+    that waits for it, logs and signals the outcome is appended to
+    ``deferred_sms``; the returned SMS status is then ``"pending"``.
+    """
 
     templates = _merge_templates()
     event_key = event.lower()
@@ -260,39 +457,67 @@ def send_certificate_notification(
         raise ValueError(f"Unsupported certificate notification event: {event}")
     config = templates[event_key]
 
-    ConsultantModel = apps.get_model("consultants", "Consultant")
-    CertificateModel = apps.get_model("consultant_app", "Certificate")
+    # The certificate row carries its consultant, so the usual case of a
+    # known certificate id is served by a single joined query.
+    consultant = None
+    certificate = None
+    if certificate_id is not None:
+        certificate = (
+            Certificate.objects.select_related("consultant")
+            .only(*_CERTIFICATE_FIELDS)
+            .filter(pk=certificate_id)
+            .first()
+        )
+        if certificate is not None and certificate.consultant_id == consultant_id:
+            consultant = certificate.consultant
 
-    try:
-        consultant = ConsultantModel.objects.get(pk=consultant_id)
-    except ConsultantModel.DoesNotExist:
-        logger.warning(
-            "Skipping certificate notification for missing consultant %s",
-            consultant_id,
-            extra={
-                "consultant_id": consultant_id,
-                "context": {
-                    "action": "certificate.notification.missing_consultant",
-                    "event": event_key,
-                    "task_id": getattr(self.request, "id", None),
+    if consultant is None:
+        try:
+            consultant = Consultant.objects.only(*_CONSULTANT_FIELDS).get(
+                pk=consultant_id
+            )
+        except Consultant.DoesNotExist:
+            logger.warning(
+                "Skipping certificate notification for missing consultant %s",
+                consultant_id,
+                extra={
+                    "consultant_id": consultant_id,
+                    "context": {
+                        "action": "certificate.notification.missing_consultant",
+                        "event": event_key,
+                        "task_id": task_id,
+                    },
                 },
-            },
-        )
-        return {"email": "skipped", "sms": "skipped"}
+            )
+            return {"email": "skipped", "sms": "skipped"}
 
-    certificate = None
-    if certificate_id is not None:
-        certificate = CertificateModel.objects.filter(pk=certificate_id).first()
     if certificate is None:
-        certificate = CertificateModel.objects.filter(
+        certificate = Certificate.objects.filter(
             consultant_id=consultant.pk
         ).order_by("-issued_at", "-status_set_at", "-pk").first()
 
     reason_text = (reason or "").strip()
-    context = _build_context(consultant, certificate, event=event_key, reason=reason_text)
+    # Signing the verification URL is the costly part of the context, so it
+    # is only built when a template that will be rendered refers to it.
+    rendered_templates = []
+    if consultant.email:
+        rendered_templates += [config.get("email_subject"), config.get("email_body")]
+    if consultant.phone_number and _should_send_sms(send_sms):
+        rendered_templates.append(config.get("sms_body"))
+    context = _build_context(
+        consultant,
+        certificate,
+        event=event_key,
+        reason=reason_text,
+        include_verification_url=any(
+            "verification_url" in _template_fields(template)
+            for template in rendered_templates
+            if template
+        ),
+    )
 
     task_metadata: dict[str, Any] = {
-        "task_id": getattr(self.request, "id", None),
+        "task_id": task_id,
         "event": event_key,
     }
     if metadata:
@@ -313,6 +538,7 @@ def send_certificate_notification(
                 config["email_subject"],
                 config["email_body"],
                 context,
+                connection=connection,
             )
             email_status = "sent" if delivered else "disabled"
     except Exception as exc:  # pragma: no cover - exercised via tests raising errors
@@ -357,7 +583,7 @@ def send_certificate_notification(
             metadata=task_metadata,
             error=None,
         )
-        if email_status == "sent":
+        if email_status == "sent" and logger.isEnabledFor(logging.INFO):
             logger.info(
                 "Sent %s certificate email notification to consultant %s",
                 event_key,
@@ -373,65 +599,140 @@ def send_certificate_notification(
             )
 
     sms_status = "disabled"
-    sms_error: Exception | None = None
+    dispatch: Callable[[], bool] | None = None
     sms_template = config.get("sms_body", "")
     if _should_send_sms(send_sms) and sms_template:
         if consultant.phone_number:
-            formatter = _SafeFormatDict(context)
-            message = sms_template.format_map(formatter).strip()
+            message = _compile_template(sms_template)(context).strip()
             if message:
-                try:
-                    dispatched = _dispatch_sms(consultant.phone_number, message)
-                    sms_status = "sent" if dispatched else "disabled"
-                except Exception as exc:
-                    sms_status = "failed"
-                    sms_error = exc
-                    logger.exception(
-                        "Failed to send %s certificate SMS to consultant %s",
-                        event_key,
-                        consultant.pk,
-                        extra={
-                            "consultant_id": consultant.pk,
-                            "context": {
-                                **task_metadata,
-                                "channel": "sms",
-                                "reason": reason_text,
-                            },
-                        },
-                    )
-                else:
-                    if sms_status == "sent":
-                        logger.info(
-                            "Sent %s certificate SMS notification to consultant %s",
-                            event_key,
-                            consultant.pk,
-                            extra={
-                                "consultant_id": consultant.pk,
-                                "context": {
-                                    **task_metadata,
-                                    "channel": "sms",
-                                    "reason": reason_text,
-                                },
-                            },
-                        )
-            else:
-                sms_status = "disabled"
+                dispatch = partial(_dispatch_sms, consultant.phone_number, message)
         else:
             sms_status = "skipped"
-    certificate_notification_dispatched.send(
-        sender=send_certificate_notification,
-        consultant_id=consultant.pk,
-        event=event_key,
-        channel="sms",
-        status=sms_status,
-        certificate_id=getattr(certificate, "pk", None),
-        reason=reason_text,
+
+    report = partial(
+        _report_sms,
+        sms_status,
+        consultant=consultant,
+        event_key=event_key,
+        certificate=certificate,
+        reason_text=reason_text,
         actor_id=actor_id,
-        metadata=task_metadata,
-        error=sms_error,
+        task_metadata=task_metadata,
     )
+    if dispatch is not None and sms_pool is not None and deferred_sms is not None:
+        deferred_sms.append(partial(report, sms_pool.submit(dispatch).result))
+        return {"email": email_status, "sms": "pending"}
 
-    return {"email": email_status, "sms": sms_status}
+    return {"email": email_status, "sms": report(dispatch)}
 
 
-__all__ = ["send_certificate_notification"]
+@shared_task(
+    bind=True,
+    name="consultant_app.send_certificate_notification",
+    autoretry_for=(NotificationDeliveryError,),
+    retry_backoff=10,
+    retry_jitter=True,
+    retry_kwargs={"max_retries": 5},
+)
+@batched_notification_logs()
+def send_certificate_notification(
+    self,
+    consultant_id: int,
+    *,
+    event: str,
+    certificate_id: int | None = None,
+    reason: str | None = None,
+    actor_id: int | None = None,
+    metadata: Mapping[str, Any] | None = None,
+    send_sms: bool | None = None,
+) -> dict[str, Any]:
+    """Send certificate lifecycle notifications to a consultant."""
+
+    return _deliver_certificate_notification(
+        consultant_id,
+        event=event,
+        certificate_id=certificate_id,
+        reason=reason,
+        actor_id=actor_id,
+        metadata=metadata,
+        send_sms=send_sms,
+        task_id=getattr(self.request, "id", None),
+    )
+
+
+@shared_task(bind=True, name="consultant_app.send_certificate_notifications_bulk")
+@batched_notification_logs()
+def send_certificate_notifications_bulk(
+    self,
+    items: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Send many certificate notifications over one mail connection.
+
+    Each item holds ``consultant_id`` plus the keyword arguments accepted by
+    :func:`send_certificate_notification`. An email that fails is handed to
+    that task so it is retried on its own instead of failing the batch.
+    SMS requests are sent from a thread pool.
+    """
+
+    task_id = getattr(self.request, "id", None)
+    results: list[dict[str, Any]] = []
+    pending: list[tuple[dict[str, Any], Callable[[], str]]] = []
+    with get_connection() as connection, ThreadPoolExecutor(
+        max_workers=_SMS_POOL_SIZE
+    ) as sms_pool:
+        for item in items:
+            options = dict(item)
+            consultant_id = options.pop("consultant_id")
+            deferred: list[Callable[[], str]] = []
+            try:
+                result = _deliver_certificate_notification(
+                    consultant_id,
+                    task_id=task_id,
+                    connection=connection,
+                    sms_pool=sms_pool,
+                    deferred_sms=deferred,
+                    **options,
+                )
+            except NotificationDeliveryError:
+                send_certificate_notification.delay(consultant_id, **options)
+                result = {"email": "requeued", "sms": "skipped"}
+            entry = {"consultant_id": consultant_id, **result}
+            results.append(entry)
+            pending.extend((entry, finish) for finish in deferred)
+
+        # SMS requests run concurrently; outcomes are logged and signalled
+        # here on the task thread, in item order.
+        for entry, finish in pending:
+            entry["sms"] = finish()
+    return results
+
+
+def dispatch_certificate_notifications(
+    items: Iterable[Mapping[str, Any]],
+    *,
+    chunk_size: int = 100,
+) -> int:
+    """Queue notifications ``chunk_size`` at a time; return the tasks queued."""
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    queued = 0
+    chunk: list[dict[str, Any]] = []
+    for item in items:
+        chunk.append(dict(item))
+        if len(chunk) == chunk_size:
+            send_certificate_notifications_bulk.delay(chunk)
+            queued += 1
+            chunk = []
+    if chunk:
+        send_certificate_notifications_bulk.delay(chunk)
+        queued += 1
+    return queued
+
+
+__all__ = [
+    "dispatch_certificate_notifications",
+    "send_certificate_notification",
+    "send_certificate_notifications_bulk",
+]
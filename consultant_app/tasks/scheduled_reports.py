@@ -10,6 +10,7 @@ from celery import shared_task
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.mail import EmailMultiAlternatives
 from django.db.models import Q
 from django.template.loader import render_to_string
@@ -23,6 +24,7 @@ from consultant_app.utils.report_exporter import (
     render_dashboard_pdf,
     summarise_rows,
 )
+from consultant_app.signals import ADMIN_REPORT_RECIPIENTS_CACHE_KEY
 from consultant_app.views import build_dashboard_queryset
 
 logger = get_task_logger(__name__)
@@ -32,6 +34,16 @@ _FREQUENCY_LABELS = {
     "monthly": "Monthly",
     "manual": "Manual",
 }
+# Account changes clear the cached recipients; the timeout bounds staleness
+# from anything the signal handlers miss, such as group renames.
+_RECIPIENTS_CACHE_TIMEOUT = 5 * 60
+# Reports requested back to back, such as a manual send right after the
+# scheduled one, reuse the same rows and rendered PDF. Nothing invalidates
+# the payload (status changes made with ``QuerySet.update()`` send no
+# signals), so this timeout is the only bound on how stale a report can be.
+_PAYLOAD_CACHE_KEY = "consultant_app.admin_report.payload"
+_PAYLOAD_CACHE_TIMEOUT = 60
+_REPORT_CHUNK_SIZE = 500
 
 
 @dataclass(frozen=True)
@@ -83,6 +95,14 @@ def _resolve_recipients() -> list[str]:
     if configured:
         return [email for email in configured if email]
 
+    return cache.get_or_set(
+        ADMIN_REPORT_RECIPIENTS_CACHE_KEY,
+        _query_admin_recipients,
+        _RECIPIENTS_CACHE_TIMEOUT,
+    )
+
+
+def _query_admin_recipients() -> list[str]:
     UserModel = get_user_model()
     admin_groups = groups_for_roles([UserRole.BOARD, UserRole.ADMIN])
     candidates = (
@@ -96,10 +116,19 @@ def _resolve_recipients() -> list[str]:
 
 
 def _build_report_payload() -> ReportPayload:
+    return cache.get_or_set(
+        _PAYLOAD_CACHE_KEY,
+        _render_report_payload,
+        _PAYLOAD_CACHE_TIMEOUT,
+    )
+
+
+def _render_report_payload() -> ReportPayload:
     queryset, filters = build_dashboard_queryset({})
     queryset = queryset.select_related("user").prefetch_related("certificate_records")
-    consultants = list(queryset)
-    rows = prepare_dashboard_rows(consultants)
+    # Stream consultants in chunks so only the flat rows, not every model
+    # instance, are held in memory while the PDF is rendered.
+    rows = prepare_dashboard_rows(queryset.iterator(chunk_size=_REPORT_CHUNK_SIZE))
     summary = summarise_rows(rows)
     filter_descriptions = describe_filters(filters)
     generated_at = timezone.localtime(timezone.now())
@@ -82,3 +82,35 @@ def test_management_command_enqueues_task(celery_tasks, user_factory, mocker):
 
     mocked_delay.assert_called_once_with(consultant.email)
     assert "task-123" in stdout.getvalue()
+
+
+@pytest.mark.django_db
+def test_send_confirmation_emails_batch_collects_failures(
+    celery_tasks, user_factory, mocker, django_assert_max_num_queries
+):
+    first = create_consultant_instance(
+        user_factory(username="celery-batch-1", role=UserRole.CONSULTANT),
+        email="celery-batch-1@example.com",
+    )
+    second = create_consultant_instance(
+        user_factory(username="celery-batch-2", role=UserRole.CONSULTANT),
+        email="celery-batch-2@example.com",
+    )
+
+    mocked_email = mocker.patch(
+        "apps.consultants.emails.send_submission_confirmation_email",
+        side_effect=[None, ConnectionError("smtp down")],
+    )
+    identifiers = [first.pk, "CELERY-BATCH-2@example.com", "missing@example.com"]
+
+    with django_assert_max_num_queries(1):
+        summary = celery_tasks.send_confirmation_emails_batch(identifiers)
+
+    assert summary == {
+        "sent": [first.pk],
+        "missing": ["missing@example.com"],
+        "failed": ["CELERY-BATCH-2@example.com"],
+    }
+    assert [call.args[0] for call in mocked_email.call_args_list] == [first, second]
+    connections = {call.kwargs["connection"] for call in mocked_email.call_args_list}
+    assert len(connections) == 1
@@ -23,50 +23,59 @@ def certificate_records(db):
     now = timezone.now()
     earlier = now - timedelta(days=30)
 
-    consultant_one = Consultant.objects.create(
-        user=user_one,
-        full_name="Alice Example",
-        id_number="ID-100",
-        dob=timezone.now().date(),
-        gender="F",
-        nationality="Kenya",
-        email="alice@example.com",
-        phone_number="0710000000",
-        business_name="Alice Consulting",
-        status="approved",
-        submitted_at=now,
+    # ``bulk_create`` skips ``save()``, so the denormalized fields are set inline.
+    consultant_one, consultant_two = Consultant.objects.bulk_create(
+        [
+            Consultant(
+                user=user_one,
+                full_name="Alice Example",
+                id_number="ID-100",
+                dob=now.date(),
+                gender="F",
+                nationality="Kenya",
+                email="alice@example.com",
+                phone_number="0710000000",
+                business_name="Alice Consulting",
+                status="approved",
+                submitted_at=now,
+                certificate_generated_at=now,
+            ),
+            Consultant(
+                user=user_two,
+                full_name="Bob Sample",
+                id_number="ID-200",
+                dob=now.date(),
+                gender="M",
+                nationality="Kenya",
+                email="bob@example.com",
+                phone_number="0720000000",
+                business_name="Sample Advisory",
+                status="approved",
+                submitted_at=earlier,
+                certificate_generated_at=earlier,
+            ),
+        ]
     )
-    consultant_two = Consultant.objects.create(
-        user=user_two,
-        full_name="Bob Sample",
-        id_number="ID-200",
-        dob=timezone.now().date(),
-        gender="M",
-        nationality="Kenya",
-        email="bob@example.com",
-        phone_number="0720000000",
-        business_name="Sample Advisory",
-        status="approved",
-        submitted_at=earlier,
-    )
-
-    for consultant, issued_at in ((consultant_one, now), (consultant_two, earlier)):
-        consultant.certificate_generated_at = issued_at
-        consultant.save(update_fields=["certificate_generated_at"])
 
-    primary = Certificate.objects.create(
-        consultant=consultant_one,
-        status=Certificate.Status.VALID,
-        issued_at=now,
-        status_set_at=now,
-        valid_at=now,
-    )
-    secondary = Certificate.objects.create(
-        consultant=consultant_two,
-        status=Certificate.Status.REVOKED,
-        issued_at=earlier,
-        status_set_at=earlier,
-        revoked_at=earlier,
+    primary, secondary = Certificate.objects.bulk_create(
+        [
+            Certificate(
+                consultant=consultant_one,
+                status=Certificate.Status.VALID,
+                issued_at=now,
+                issued_at_iso=Certificate.serialize_issued_at(now),
+                status_set_at=now,
+                valid_at=now,
+            ),
+            Certificate(
+                consultant=consultant_two,
+                status=Certificate.Status.REVOKED,
+                issued_at=earlier,
+                issued_at_iso=Certificate.serialize_issued_at(earlier),
+                status_set_at=earlier,
+                revoked_at=earlier,
+            ),
+        ]
     )
 
     return {"primary": primary, "secondary": secondary}
@@ -29,11 +29,12 @@ def consultant_with_active_certificate(db):
         password="safe-pass-456",
     )
 
+    now = timezone.now()
     consultant = Consultant.objects.create(
         user=applicant,
         full_name="Cert Test",
         id_number="CERT-001",
-        dob=timezone.now().date(),
+        dob=now.date(),
         gender="M",
         nationality="Kenya",
         email="applicant-cert@example.com",
@@ -41,16 +42,15 @@ def consultant_with_active_certificate(db):
         business_name="Certificate Testing",
         registration_number="REG-001",
         status="approved",
-        submitted_at=timezone.now(),
+        submitted_at=now,
     )
 
-    issued_at = timezone.now()
     certificate = Certificate.objects.create(
         consultant=consultant,
         status=Certificate.Status.VALID,
-        issued_at=issued_at,
-        status_set_at=issued_at,
-        valid_at=issued_at,
+        issued_at=now,
+        status_set_at=now,
+        valid_at=now,
     )
 
     return consultant, certificate
@@ -60,7 +60,6 @@ def consultant_with_active_certificate(db):
 def test_update_certificate_status_records_reason_and_logs(
     staff_user, consultant_with_active_certificate
 ):
-    LogEntry.objects.all().delete()
     consultant, certificate = consultant_with_active_certificate
 
     reason = "Revoked for compliance review"
@@ -77,7 +76,9 @@ def test_update_certificate_status_records_reason_and_logs(
     assert certificate.status_reason == reason
     assert certificate.revoked_at is not None
 
-    log_entry = LogEntry.objects.latest("timestamp")
+    log_entry = LogEntry.objects.filter(
+        context__consultant_id=consultant.pk
+    ).latest("timestamp")
     assert log_entry.user_id == staff_user.pk
     assert log_entry.context["action"] == "certificate.status.revoked"
     assert log_entry.context["consultant_id"] == consultant.pk
@@ -87,7 +88,6 @@ def test_update_certificate_status_records_reason_and_logs(
 
 @pytest.mark.django_db
 def test_update_certificate_status_logs_missing_certificate(staff_user):
-    LogEntry.objects.all().delete()
     user_model = get_user_model()
     applicant = user_model.objects.create_user(
         username="missing-cert",
@@ -118,7 +118,9 @@ def test_update_certificate_status_logs_missing_certificate(staff_user):
     )
 
     assert result is None
-    log_entry = LogEntry.objects.latest("timestamp")
+    log_entry = LogEntry.objects.filter(
+        context__consultant_id=consultant.pk
+    ).latest("timestamp")
     assert log_entry.context["action"] == "certificate.status.missing"
     assert log_entry.context["consultant_id"] == consultant.pk
     assert log_entry.context["requested_status"] == Certificate.Status.REVOKED.value
@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 import pytest
 from django.contrib.auth import get_user_model
 from django.core.files.base import ContentFile
@@ -11,19 +13,24 @@ from consultant_app.certificates import (
 )
 from consultant_app.models import Certificate
 from consultant_app.tasks import (
+    _resolve_consultant,
+    delete_storage_file_task,
     reissue_certificate_task,
+    render_certificates_batch_task,
     revoke_certificate_task,
 )
 
 
 @pytest.fixture
-def temporary_media_root(tmp_path, settings):
-    settings.MEDIA_ROOT = tmp_path
-    return tmp_path
+def in_memory_storage(settings):
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+    }
 
 
 @pytest.fixture
-def consultant_with_live_certificate(db, temporary_media_root):
+def consultant_with_live_certificate(db, in_memory_storage):
     user_model = get_user_model()
     user = user_model.objects.create_user(
         username="cert-task-user",
@@ -31,11 +38,12 @@ def consultant_with_live_certificate(db, temporary_media_root):
         password="secure-pass-123",
     )
 
+    now = timezone.now()
     consultant = Consultant.objects.create(
         user=user,
         full_name="Task Runner",
         id_number="TASK-001",
-        dob=timezone.now().date(),
+        dob=now.date(),
         gender="M",
         nationality="Kenya",
         email="cert-task@example.com",
@@ -43,17 +51,9 @@ def consultant_with_live_certificate(db, temporary_media_root):
         business_name="Task Testing",
         registration_number="REG-001",
         status="approved",
-        submitted_at=timezone.now(),
-    )
-
-    issued_at = timezone.now()
-    consultant.certificate_generated_at = issued_at
-    consultant.certificate_expires_at = timezone.localdate()
-    consultant.save(
-        update_fields=[
-            "certificate_generated_at",
-            "certificate_expires_at",
-        ]
+        submitted_at=now,
+        certificate_generated_at=now,
+        certificate_expires_at=timezone.localdate(now),
     )
 
     consultant.certificate_pdf.save("initial.pdf", ContentFile(b"%PDF-1.4"), save=True)
@@ -61,16 +61,42 @@ def consultant_with_live_certificate(db, temporary_media_root):
     certificate = Certificate.objects.create(
         consultant=consultant,
         status=Certificate.Status.VALID,
-        issued_at=issued_at,
-        status_set_at=issued_at,
-        valid_at=issued_at,
+        issued_at=now,
+        status_set_at=now,
+        valid_at=now,
     )
 
-    yield consultant, certificate
+    return consultant, certificate
 
-    consultant.refresh_from_db()
-    if consultant.certificate_pdf:
-        consultant.certificate_pdf.delete(save=False)
+
+@pytest.mark.django_db
+def test_resolve_consultant_matches_account_email_in_one_query(
+    consultant_with_live_certificate, django_assert_num_queries
+):
+    consultant, _ = consultant_with_live_certificate
+    consultant.email = "applicant@example.com"
+    consultant.save(update_fields=["email"])
+
+    with django_assert_num_queries(1):
+        assert _resolve_consultant(" CERT-TASK@example.com ") == consultant
+
+    assert _resolve_consultant("Applicant@Example.com") == consultant
+    with pytest.raises(Consultant.DoesNotExist):
+        _resolve_consultant("missing@example.com")
+
+
+@pytest.mark.django_db
+def test_resolve_consultant_dispatches_on_identifier_type(
+    consultant_with_live_certificate,
+):
+    consultant, _ = consultant_with_live_certificate
+
+    assert _resolve_consultant(consultant.pk) == consultant
+    assert _resolve_consultant(f" {consultant.pk} ") == consultant
+    assert _resolve_consultant(str(consultant.pk).encode()) == consultant
+    for identifier in (None, 1.5, "not-an-identifier"):
+        with pytest.raises(Consultant.DoesNotExist):
+            _resolve_consultant(identifier)
 
 
 @pytest.mark.django_db
@@ -117,6 +143,8 @@ def test_reissue_certificate_task_regenerates_certificate(consultant_with_live_c
     assert new_certificate.pk != previous_certificate.pk
     assert new_certificate.status == Certificate.Status.VALID
     assert consultant.certificate_generated_at == new_certificate.issued_at
+    assert previous_certificate.reissued_at == new_certificate.issued_at
+    assert consultant.updated_at == new_certificate.issued_at
     assert consultant.certificate_pdf
     assert consultant.certificate_pdf.name.endswith(
         f"approval-certificate-{consultant.pk}.pdf"
@@ -129,6 +157,150 @@ def test_reissue_certificate_task_regenerates_certificate(consultant_with_live_c
         verify_certificate_token(original_token, consultant)
 
 
+@pytest.mark.django_db
+def test_reissue_certificate_task_renders_outside_transaction(
+    consultant_with_live_certificate, mocker
+):
+    from io import BytesIO
+
+    from django.db import connection
+
+    consultant, _ = consultant_with_live_certificate
+    outer_depth = len(connection.atomic_blocks)
+    render_depths = []
+
+    def fake_render(*args, **kwargs):
+        render_depths.append(len(connection.atomic_blocks))
+        return BytesIO(b"%PDF-1.4 reissued")
+
+    mocker.patch(
+        "consultant_app.tasks.render_certificate_pdf", side_effect=fake_render
+    )
+
+    reissue_certificate_task(
+        consultant.pk, reason="Refresh", actor_id=None, notify_consultant=False
+    )
+
+    consultant.refresh_from_db()
+    assert render_depths == [outer_depth]
+    assert consultant.certificate_pdf.read() == b"%PDF-1.4 reissued"
+
+
+@pytest.mark.django_db
+def test_reissue_certificate_task_defers_old_pdf_cleanup(
+    consultant_with_live_certificate, django_capture_on_commit_callbacks, mocker
+):
+    consultant, _ = consultant_with_live_certificate
+    previous_name = consultant.certificate_pdf.name
+    mocked_delete = mocker.patch("consultant_app.tasks.delete_storage_file_task.delay")
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        reissue_certificate_task(
+            consultant.pk, reason="Refresh", actor_id=None, notify_consultant=False
+        )
+
+    consultant.refresh_from_db()
+    assert consultant.certificate_pdf.name != previous_name
+    assert consultant.certificate_pdf.storage.exists(previous_name)
+    mocked_delete.assert_not_called()
+
+    for callback in callbacks:
+        callback()
+
+    mocked_delete.assert_called_once_with(previous_name)
+
+
+@pytest.mark.django_db
+def test_reissue_certificate_task_keeps_pdf_overwritten_in_place(
+    consultant_with_live_certificate, django_capture_on_commit_callbacks, mocker
+):
+    consultant, _ = consultant_with_live_certificate
+    previous_name = consultant.certificate_pdf.name
+    storage = consultant.certificate_pdf.storage
+    mocker.patch.object(storage, "save", return_value=previous_name)
+    mocked_delete = mocker.patch("consultant_app.tasks.delete_storage_file_task.delay")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        reissue_certificate_task(
+            consultant.pk, reason="Refresh", actor_id=None, notify_consultant=False
+        )
+
+    consultant.refresh_from_db()
+    assert consultant.certificate_pdf.name == previous_name
+    mocked_delete.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_reissue_certificate_task_keeps_newer_concurrent_pdf(
+    consultant_with_live_certificate, django_capture_on_commit_callbacks, mocker
+):
+    from io import BytesIO
+
+    consultant, _ = consultant_with_live_certificate
+    previous_name = consultant.certificate_pdf.name
+    newer_issue = timezone.now() + timedelta(minutes=5)
+
+    def fake_render(*args, **kwargs):
+        # A newer reissue commits while this one is still rendering.
+        Consultant.objects.filter(pk=consultant.pk).update(
+            certificate_generated_at=newer_issue
+        )
+        return BytesIO(b"%PDF-1.4 stale")
+
+    mocker.patch(
+        "consultant_app.tasks.render_certificate_pdf", side_effect=fake_render
+    )
+    mocked_delete = mocker.patch("consultant_app.tasks.delete_storage_file_task.delay")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        reissue_certificate_task(
+            consultant.pk, reason="Refresh", actor_id=None, notify_consultant=False
+        )
+
+    consultant.refresh_from_db()
+    assert consultant.certificate_generated_at == newer_issue
+    assert consultant.certificate_pdf.name == previous_name
+    (discarded,), _ = mocked_delete.call_args
+    assert discarded != previous_name
+
+
+@pytest.mark.django_db
+def test_reissue_certificate_task_retry_resumes_committed_reissue(
+    consultant_with_live_certificate, mocker
+):
+    from io import BytesIO
+
+    consultant, previous_certificate = consultant_with_live_certificate
+    mocker.patch(
+        "consultant_app.tasks.render_certificate_pdf",
+        side_effect=[TimeoutError("renderer unavailable"), BytesIO(b"%PDF-1.4 retry")],
+    )
+
+    with pytest.raises(TimeoutError):
+        reissue_certificate_task(
+            consultant.pk, reason="Refresh", actor_id=None, notify_consultant=False
+        )
+
+    consultant.refresh_from_db()
+    fresh_certificate = Certificate.objects.latest_for_consultant(consultant)
+    assert fresh_certificate.status == Certificate.Status.VALID
+    assert consultant.certificate_generated_at == fresh_certificate.issued_at
+
+    reissue_certificate_task.apply(
+        args=(consultant.pk,),
+        kwargs={"reason": "Refresh", "actor_id": None, "notify_consultant": False},
+        retries=1,
+        throw=True,
+    )
+
+    consultant.refresh_from_db()
+    assert Certificate.objects.filter(consultant=consultant).count() == 2
+    assert Certificate.objects.latest_for_consultant(consultant) == fresh_certificate
+    assert consultant.certificate_pdf.read() == b"%PDF-1.4 retry"
+    previous_certificate.refresh_from_db()
+    assert previous_certificate.status == Certificate.Status.REISSUED
+
+
 @pytest.mark.django_db
 def test_certificate_tasks_dispatch_notifications(consultant_with_live_certificate, mocker):
     consultant, _ = consultant_with_live_certificate
@@ -161,3 +333,139 @@ def test_certificate_tasks_dispatch_notifications(consultant_with_live_certifica
     events = [call.kwargs.get("event") for call in mocked_delay.call_args_list]
     assert events.count("revoked") == 1
     assert events.count("reissued") == 1
+
+
+@pytest.mark.django_db
+def test_render_certificates_batch_task_skips_inactive_certificates(
+    consultant_with_live_certificate,
+):
+    consultant, _ = consultant_with_live_certificate
+    inactive_user = get_user_model().objects.create_user(
+        username="cert-task-inactive",
+        email="cert-task-inactive@example.com",
+        password="secure-pass-123",
+    )
+    inactive = Consultant.objects.create(
+        user=inactive_user,
+        full_name="No Certificate",
+        id_number="TASK-002",
+        dob=timezone.now().date(),
+        gender="F",
+        nationality="Kenya",
+        email="cert-task-inactive@example.com",
+        phone_number="0700000002",
+        business_name="Task Testing",
+        status="submitted",
+        submitted_at=timezone.now(),
+    )
+
+    rendered = render_certificates_batch_task(
+        [consultant.pk, inactive.pk], actor_id=None
+    )
+
+    assert rendered == [consultant.pk]
+    consultant.refresh_from_db()
+    assert consultant.certificate_pdf.name.endswith(".pdf")
+    with consultant.certificate_pdf.open("rb") as handle:
+        assert handle.read().startswith(b"%PDF")
+
+
+@pytest.mark.django_db
+def test_render_certificates_batch_task_skips_superseded_issue(
+    consultant_with_live_certificate, django_capture_on_commit_callbacks, mocker
+):
+    from io import BytesIO
+
+    consultant, _ = consultant_with_live_certificate
+    previous_name = consultant.certificate_pdf.name
+    newer_issue = timezone.now() + timedelta(minutes=5)
+
+    def fake_batch_render(consultants, **kwargs):
+        # A reissue commits while the batch is rendering.
+        Consultant.objects.filter(pk=consultant.pk).update(
+            certificate_generated_at=newer_issue
+        )
+        return [BytesIO(b"%PDF-1.4 superseded") for _ in consultants]
+
+    mocker.patch(
+        "consultant_app.tasks.render_certificates_batch",
+        side_effect=fake_batch_render,
+    )
+    mocked_delete = mocker.patch("consultant_app.tasks.delete_storage_file_task.delay")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        rendered = render_certificates_batch_task([consultant.pk], actor_id=None)
+
+    assert rendered == []
+    consultant.refresh_from_db()
+    assert consultant.certificate_pdf.name == previous_name
+    (discarded,), _ = mocked_delete.call_args
+    assert discarded != previous_name
+
+
+def test_io_bound_tasks_route_to_dedicated_queue():
+    from django.conf import settings
+
+    from consultant_app.tasks import celery_app, send_confirmation_email
+
+    routes = celery_app.conf.task_routes
+    assert routes[send_confirmation_email.name] == {
+        "queue": settings.CELERY_IO_BOUND_QUEUE
+    }
+    # Rendering and database work block a gevent hub, so certificate tasks
+    # stay on the default prefork queue.
+    for task in (
+        revoke_certificate_task,
+        reissue_certificate_task,
+        delete_storage_file_task,
+        render_certificates_batch_task,
+    ):
+        assert task.name not in routes
+
+
+def test_certificate_tasks_acknowledge_late():
+    from consultant_app.tasks import celery_app
+
+    for task in (
+        revoke_certificate_task,
+        reissue_certificate_task,
+        delete_storage_file_task,
+    ):
+        assert task.acks_late is True
+        assert task.reject_on_worker_lost is True
+    assert celery_app.conf.worker_prefetch_multiplier == 1
+
+
+def test_worker_tasks_close_stale_connections(mocker):
+    from types import SimpleNamespace
+
+    from consultant_app import tasks
+
+    close = mocker.patch("consultant_app.tasks.close_old_connections")
+
+    tasks._close_stale_connections(task=SimpleNamespace(request=SimpleNamespace()))
+    tasks._close_stale_connections(
+        task=SimpleNamespace(request=SimpleNamespace(is_eager=True))
+    )
+
+    close.assert_called_once_with()
+
+
+@pytest.mark.django_db
+def test_resolve_actor_loads_display_fields_only(django_assert_num_queries):
+    from consultant_app.tasks import _actor_display, _resolve_actor
+
+    actor = get_user_model().objects.create_user(
+        username="cert-actor",
+        email="actor@example.com",
+        password="secure-pass-123",
+        first_name="Ada",
+        last_name="Admin",
+    )
+
+    with django_assert_num_queries(1):
+        resolved = _resolve_actor(actor.pk)
+        assert _actor_display(resolved) == "Ada Admin"
+
+    assert "password" in resolved.get_deferred_fields()
+    assert _resolve_actor(None) is None
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import base64
 import uuid
 from datetime import timedelta
 from io import BytesIO
 
 import pytest
 from django.contrib.auth import get_user_model
-from django.core.files.base import ContentFile
+from django.core import signing
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from PIL import Image
@@ -14,13 +18,20 @@ from PIL import Image
 from apps.consultants.models import Consultant
 from consultant_app.models import Certificate
 from consultant_app.certificates import (
+    _image_to_data_uri,
     CertificateTokenError,
     build_certificate_token,
+    PDF_ENGINE_REPORTLAB,
     build_verification_url,
+    render_certificate_pdf,
+    render_certificates_batch,
     update_certificate_status,
     verify_certificate_token,
 )
-from utils.qr_generator import generate_qr_code
+from utils.qr_generator import (
+    generate_qr_code,
+    generate_qr_svg,
+)
 
 
 @pytest.fixture
@@ -29,11 +40,12 @@ def consultant_with_certificate(db):
         username="verified", email="verified@example.com", password="testpass123"
     )
 
+    now = timezone.now()
     consultant = Consultant.objects.create(
         user=user,
         full_name="Verified Consultant",
         id_number="ID-123",
-        dob=timezone.now().date(),
+        dob=now.date(),
         gender="M",
         nationality="Kenya",
         email="verified@example.com",
@@ -41,31 +53,25 @@ def consultant_with_certificate(db):
         business_name="Verified Business",
         registration_number="REG-123",
         status="approved",
-        submitted_at=timezone.now(),
+        submitted_at=now,
+        certificate_generated_at=now,
+        certificate_expires_at=timezone.localdate(now),
+        # Only the presence of the file is checked, so no bytes are stored.
+        certificate_pdf="certificates/signed/certificate.pdf",
     )
 
-    consultant.certificate_generated_at = timezone.now()
-    consultant.certificate_expires_at = timezone.localdate()
-    consultant.save(
-        update_fields=[
-            "certificate_generated_at",
-            "certificate_expires_at",
-        ]
-    )
-    consultant.certificate_pdf.save(
-        "certificate.pdf", ContentFile(b"%PDF-1.4"), save=True
-    )
-
-    Certificate.objects.create(
+    certificate = Certificate.objects.create(
         consultant=consultant,
         status=Certificate.Status.VALID,
-        issued_at=consultant.certificate_generated_at,
-        status_set_at=consultant.certificate_generated_at,
-        valid_at=consultant.certificate_generated_at,
+        issued_at=now,
+        status_set_at=now,
+        valid_at=now,
     )
 
     consultant.refresh_from_db()
     assert consultant.certificate_uuid is not None
+    # Exposed so tests can reach the record without another lookup.
+    consultant.latest_certificate = certificate
     return consultant
 
 
@@ -79,6 +85,72 @@ def test_generate_qr_code_returns_image():
     assert buffer.tell() > 0
 
 
+def test_generate_qr_svg_returns_inline_svg():
+    svg = generate_qr_svg("https://example.com/verify", box_size=8, border=2)
+
+    assert svg.startswith("<svg")
+    assert "<?xml" not in svg
+    assert "<path" in svg
+
+
+@pytest.mark.django_db
+def test_render_certificate_pdf_reportlab_engine(consultant_with_certificate):
+    consultant = consultant_with_certificate
+    signature = BytesIO()
+    Image.new("RGB", (40, 20), "black").save(signature, format="PNG")
+    signature.seek(0)
+    signature.name = "signature.png"
+
+    pdf_stream = render_certificate_pdf(
+        consultant,
+        issued_at=timezone.localdate(),
+        verification_url=build_verification_url(consultant),
+        generated_by="Board Reviewer",
+        signature_image=signature,
+        engine=PDF_ENGINE_REPORTLAB,
+    )
+
+    pdf_bytes = pdf_stream.getvalue()
+    assert pdf_bytes.startswith(b"%PDF-")
+    assert pdf_bytes.rstrip().endswith(b"%%EOF")
+
+
+@pytest.mark.django_db
+def test_render_certificate_pdf_rejects_unknown_engine(consultant_with_certificate):
+    with pytest.raises(ValueError):
+        render_certificate_pdf(
+            consultant_with_certificate,
+            issued_at=timezone.localdate(),
+            verification_url="https://example.com/verify",
+            engine="unknown",
+        )
+
+
+@pytest.mark.django_db
+def test_render_certificates_batch_honours_reportlab_engine(
+    consultant_with_certificate, settings
+):
+    settings.CERTIFICATE_PDF_ENGINE = PDF_ENGINE_REPORTLAB
+
+    (pdf_stream,) = render_certificates_batch([consultant_with_certificate])
+
+    pdf_bytes = pdf_stream.getvalue()
+    assert pdf_bytes.startswith(b"%PDF-")
+    assert b"ReportLab" in pdf_bytes
+
+
+def test_image_to_data_uri_streams_uploaded_files():
+    payload = bytes(range(256)) * 500
+    upload = BytesIO(payload)
+    upload.name = "signature.png"
+    upload.seek(123)
+
+    data_uri = _image_to_data_uri(upload)
+
+    assert data_uri == "data:image/png;base64," + base64.b64encode(payload[123:]).decode()
+    assert upload.tell() == 0
+
+
 @pytest.mark.django_db
 def test_certificate_token_round_trip(consultant_with_certificate):
     consultant = consultant_with_certificate
@@ -89,6 +161,89 @@ def test_certificate_token_round_trip(consultant_with_certificate):
     assert metadata.issued_at == consultant.certificate_generated_at.isoformat()
 
 
+@pytest.mark.django_db
+def test_certificate_records_store_serialized_issue_timestamp(
+    consultant_with_certificate,
+):
+    consultant = consultant_with_certificate
+    certificate = Certificate.objects.get(consultant=consultant)
+
+    assert certificate.issued_at_iso == certificate.issued_at.isoformat()
+    assert (
+        Certificate.objects.matching_issue_timestamp(
+            consultant, certificate.issued_at_iso
+        )
+        == certificate
+    )
+    assert Certificate.objects.matching_issue_timestamp(consultant, "not-a-date") is None
+
+
+@pytest.mark.django_db
+def test_certificate_manager_helpers_reuse_consultant_instance(
+    consultant_with_certificate, django_assert_num_queries
+):
+    consultant = consultant_with_certificate
+
+    with django_assert_num_queries(2):
+        latest = Certificate.objects.latest_for_consultant(consultant)
+        active = Certificate.objects.active_for_consultant(consultant)
+        assert latest.consultant is consultant
+        assert active.consultant is consultant
+
+
+@pytest.mark.django_db
+def test_certificate_token_accepts_json_serialized_tokens(consultant_with_certificate):
+    consultant = consultant_with_certificate
+    certificate = consultant.latest_certificate
+    legacy_token = signing.dumps(
+        {"consultant_id": consultant.pk, "issued_at": certificate.issued_at_iso},
+        salt="consultant_app.certificates.token",
+        compress=True,
+    )
+
+    assert verify_certificate_token(legacy_token, consultant).consultant_id == consultant.pk
+
+
+@pytest.mark.django_db
+def test_certificate_token_is_cached_per_issue(consultant_with_certificate, mocker):
+    consultant = consultant_with_certificate
+    cache.clear()
+    sign_object = mocker.spy(signing.TimestampSigner, "sign_object")
+
+    first = build_certificate_token(consultant)
+    second = build_certificate_token(consultant)
+
+    assert first == second
+    assert sign_object.call_count == 1
+    assert signing.loads(first, salt="consultant_app.certificates.token")["consultant_id"] == consultant.pk
+    assert verify_certificate_token(second, consultant).consultant_id == consultant.pk
+
+
+@pytest.mark.django_db
+def test_certificate_token_cache_follows_secret_key(
+    consultant_with_certificate, settings
+):
+    consultant = consultant_with_certificate
+    cache.clear()
+    original = build_certificate_token(consultant)
+
+    settings.SECRET_KEY = "rotated-secret-key-for-certificate-tokens"
+    rotated = build_certificate_token(consultant)
+
+    assert rotated != original
+    assert verify_certificate_token(rotated, consultant).consultant_id == consultant.pk
+
+
+@pytest.mark.django_db
+def test_build_certificate_token_uses_single_lookup(
+    consultant_with_certificate, django_assert_num_queries
+):
+    consultant = consultant_with_certificate
+
+    with django_assert_num_queries(1):
+        build_certificate_token(consultant)
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "status,error_message",
@@ -104,8 +259,11 @@ def test_certificate_token_rejects_inactive_statuses(
     consultant = consultant_with_certificate
     token = build_certificate_token(consultant)
 
-    certificate = Certificate.objects.latest_for_consultant(consultant)
-    certificate.mark_status(status.value, timestamp=timezone.now(), reason=f"{status.label} test")
+    Certificate.objects.filter(pk=consultant.latest_certificate.pk).update(
+        status=status.value,
+        status_set_at=timezone.now(),
+        status_reason=f"{status.label} test",
+    )
 
     with pytest.raises(CertificateTokenError) as exc:
         verify_certificate_token(token, consultant)
@@ -113,12 +271,33 @@ def test_certificate_token_rejects_inactive_statuses(
     assert str(exc.value) == error_message
 
 
+@pytest.mark.django_db
+def test_mark_status_writes_only_transition_columns(
+    consultant_with_certificate, django_assert_num_queries
+):
+    certificate = consultant_with_certificate.latest_certificate
+    revoked_at = timezone.now()
+
+    with django_assert_num_queries(1) as captured:
+        certificate.mark_status(Certificate.Status.REVOKED, timestamp=revoked_at)
+
+    update_sql = captured.captured_queries[0]["sql"]
+    assert '"revoked_at"' in update_sql
+    assert '"valid_at"' not in update_sql
+    assert '"status_reason"' not in update_sql
+
+    certificate.refresh_from_db()
+    assert certificate.status == Certificate.Status.REVOKED
+    assert certificate.revoked_at == revoked_at
+    assert certificate.valid_at is not None
+
+
 @pytest.mark.django_db
 def test_certificate_token_double_revoke_remains_blocked(consultant_with_certificate):
     consultant = consultant_with_certificate
     token = build_certificate_token(consultant)
 
-    certificate = Certificate.objects.latest_for_consultant(consultant)
+    certificate = consultant.latest_certificate
     update_certificate_status(
         consultant,
         status=Certificate.Status.REVOKED,
@@ -180,6 +359,46 @@ def test_build_verification_url_includes_uuid(consultant_with_certificate):
     assert str(consultant.certificate_uuid) in url
 
 
+@pytest.mark.django_db
+def test_build_verification_url_matches_reversed_route(
+    consultant_with_certificate, settings
+):
+    consultant = consultant_with_certificate
+    settings.CERTIFICATE_VERIFY_BASE_URL = "https://certs.example.com/"
+    expected_path = reverse(
+        "consultant-certificate-verify",
+        kwargs={"certificate_uuid": consultant.certificate_uuid},
+    )
+
+    url = build_verification_url(consultant)
+
+    assert url.startswith(f"https://certs.example.com{expected_path}?token=")
+
+
+@pytest.mark.django_db
+def test_verify_certificate_view_reuses_prefetched_history(
+    client, consultant_with_certificate
+):
+    consultant = consultant_with_certificate
+    token = build_certificate_token(consultant)
+    url = reverse(
+        "consultant-certificate-verify",
+        kwargs={"certificate_uuid": consultant.certificate_uuid},
+    )
+
+    with CaptureQueriesContext(connection) as captured:
+        response = client.get(url, {"token": token})
+
+    assert response.status_code == 200
+    assert response.context["verified"] is True
+    certificate_queries = [
+        query
+        for query in captured.captured_queries
+        if Certificate._meta.db_table in query["sql"]
+    ]
+    assert len(certificate_queries) == 1
+
+
 @pytest.mark.django_db
 def test_verify_certificate_view_success(client, consultant_with_certificate):
     consultant = consultant_with_certificate
@@ -210,11 +429,10 @@ def test_verify_certificate_view_marks_expired_certificate(client, consultant_wi
     consultant.certificate_expires_at = timezone.localdate() - timedelta(days=1)
     consultant.save(update_fields=["certificate_expires_at"])
     token = build_certificate_token(consultant)
-    certificate = Certificate.objects.latest_for_consultant(consultant)
-    certificate.mark_status(
-        Certificate.Status.EXPIRED,
-        timestamp=timezone.now(),
-        reason="Expired automatically",
+    Certificate.objects.filter(pk=consultant.latest_certificate.pk).update(
+        status=Certificate.Status.EXPIRED,
+        status_set_at=timezone.now(),
+        status_reason="Expired automatically",
     )
 
     url = reverse(
@@ -238,11 +456,10 @@ def test_verify_certificate_view_marks_revoked_certificate(client, consultant_wi
     consultant.certificate_expires_at = timezone.localdate() + timedelta(days=10)
     consultant.save(update_fields=["certificate_expires_at"])
     token = build_certificate_token(consultant)
-    certificate = Certificate.objects.latest_for_consultant(consultant)
-    certificate.mark_status(
-        Certificate.Status.REVOKED,
-        timestamp=timezone.now(),
-        reason="Revoked for testing",
+    Certificate.objects.filter(pk=consultant.latest_certificate.pk).update(
+        status=Certificate.Status.REVOKED,
+        status_set_at=timezone.now(),
+        status_reason="Revoked for testing",
     )
 
     url = reverse(
@@ -263,11 +480,10 @@ def test_verify_certificate_view_marks_revoked_certificate(client, consultant_wi
 def test_verify_certificate_view_handles_reissued_certificate(client, consultant_with_certificate):
     consultant = consultant_with_certificate
     token = build_certificate_token(consultant)
-    certificate = Certificate.objects.latest_for_consultant(consultant)
-    certificate.mark_status(
-        Certificate.Status.REISSUED,
-        timestamp=timezone.now(),
-        reason="Reissued with updated details",
+    Certificate.objects.filter(pk=consultant.latest_certificate.pk).update(
+        status=Certificate.Status.REISSUED,
+        status_set_at=timezone.now(),
+        status_reason="Reissued with updated details",
     )
 
     url = reverse(
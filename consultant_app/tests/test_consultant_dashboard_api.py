@@ -10,6 +10,7 @@ from django.contrib.auth import get_user_model
 from django.utils import timezone
 
 from apps.consultants.models import Consultant
+from consultant_app.serializers import ConsultantDashboardSerializer
 
 
 @pytest.fixture
@@ -196,6 +197,30 @@ def test_dashboard_reports_missing_documents(client, consultant_factory):
     }
 
 
+@pytest.mark.django_db
+def test_dashboard_serializer_reads_annotated_document_flags(consultant_factory):
+    consultant_factory(
+        photo="documents/photos/bob.jpg",
+        cv="documents/cv/bob.pdf",
+        id_document="",
+    )
+
+    consultant = ConsultantDashboardSerializer.prepare_queryset(
+        Consultant.objects.all()
+    ).get()
+
+    assert consultant._has_photo == 1
+    assert consultant._has_id_document == 0
+    assert consultant._has_police_clearance == 0
+    assert "photo" in consultant.get_deferred_fields()
+    assert ConsultantDashboardSerializer(consultant).data["documents"]["missing"] == [
+        "ID document",
+        "Police clearance",
+        "Qualifications",
+        "Business certificate",
+    ]
+
+
 @pytest.mark.django_db
 def test_dashboard_excludes_draft_applications(client, consultant_factory):
     """Board reviewers should not see draft applications in the listing."""
@@ -214,3 +239,18 @@ def test_dashboard_excludes_draft_applications(client, consultant_factory):
     filtered = client.get("/api/staff/consultants/", {"status": "draft"})
     assert filtered.status_code == 200
     assert filtered.json()["pagination"]["total_results"] == 0
+
+
+@pytest.mark.django_db
+def test_dashboard_serializer_respects_active_timezone(consultant_factory):
+    submitted_at = timezone.now().replace(microsecond=0)
+    consultant = consultant_factory(submitted_at=submitted_at)
+
+    with timezone.override("Africa/Nairobi"):
+        nairobi = ConsultantDashboardSerializer(consultant).data["submitted_at"]
+    with timezone.override("UTC"):
+        utc = ConsultantDashboardSerializer(consultant).data["submitted_at"]
+
+    assert nairobi.endswith("+03:00")
+    assert utc.endswith("+00:00")
+    assert nairobi != utc
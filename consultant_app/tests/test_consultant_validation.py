@@ -1,5 +1,6 @@
 from datetime import date
 import json
+import re
 
 import pytest
 from django.contrib.auth import get_user_model
@@ -50,3 +51,113 @@ def test_duplicate_values_return_validation_errors(client):
     assert body['errors']['registration_number'] == (
         'A consultant with this registration number already exists.'
     )
+
+
+@pytest.mark.django_db
+def test_validation_checks_all_fields_in_one_query(django_assert_num_queries):
+    from consultant_app.serializers import ConsultantValidationSerializer
+
+    owner = get_user_model().objects.create_user(
+        username='other', email='other@example.com', password='password123',
+    )
+    Consultant.objects.create(
+        user=owner,
+        full_name='Other Consultant',
+        id_number='ID-456',
+        dob=date(1990, 1, 1),
+        gender='F',
+        nationality='Uganda',
+        email='Shared@Example.com',
+        phone_number='0700000001',
+        business_name='Other Business',
+        registration_number='REG-456',
+        status='submitted',
+    )
+
+    serializer = ConsultantValidationSerializer(
+        {
+            'email': 'shared@example.com',
+            'nationality': 'Kenya',
+            'id_number': 'id-456',
+            'registration_number': 'REG-999',
+        }
+    )
+
+    with django_assert_num_queries(1):
+        assert not serializer.is_valid()
+
+    assert set(serializer.errors) == {'id_number'}
+
+
+@pytest.mark.django_db
+def test_duplicate_probes_compare_lowercased_columns(django_assert_num_queries):
+    from consultant_app.serializers import ConsultantValidationSerializer
+
+    serializer = ConsultantValidationSerializer(
+        {
+            'email': 'Probe@Example.com',
+            'nationality': 'Kenya',
+            'id_number': 'ID-789',
+            'registration_number': 'REG-789',
+        }
+    )
+
+    with django_assert_num_queries(1) as captured:
+        assert serializer.is_valid()
+
+    sql = captured.captured_queries[0]['sql']
+    for column in ('email', 'nationality', 'id_number', 'registration_number'):
+        assert re.search(rf'LOWER\([\w"]+\."{column}"\) = \(?LOWER\(', sql)
+    assert 'UPPER(' not in sql
+    assert ' LIKE ' not in sql
+
+
+@pytest.mark.django_db
+def test_validation_reports_malformed_fields(client):
+    response = client.post(
+        '/api/consultants/validate/',
+        data=json.dumps({'email': 'not-an-email', 'consultant_id': 'abc'}),
+        content_type='application/json',
+    )
+
+    assert response.status_code == 400
+    errors = response.json()['errors']
+    assert errors['email'] == 'Enter a valid email address.'
+    assert errors['consultant_id'] == 'Enter a whole number.'
+
+
+@pytest.mark.django_db
+def test_validation_ignores_the_consultant_being_edited(django_assert_num_queries):
+    from consultant_app.serializers import ConsultantValidationSerializer
+
+    owner = get_user_model().objects.create_user(
+        username='editing', email='editing@example.com', password='password123',
+    )
+    consultant = Consultant.objects.create(
+        user=owner,
+        full_name='Editing Consultant',
+        id_number='ID-321',
+        dob=date(1990, 1, 1),
+        gender='M',
+        nationality='Kenya',
+        email='editing@example.com',
+        phone_number='0700000002',
+        business_name='Editing Business',
+        registration_number='REG-321',
+        status='draft',
+    )
+
+    serializer = ConsultantValidationSerializer(
+        {
+            'email': 'editing@example.com',
+            'nationality': 'Kenya',
+            'id_number': 'ID-321',
+            'registration_number': 'REG-321',
+            'consultant_id': consultant.pk,
+        }
+    )
+
+    with django_assert_num_queries(1):
+        assert serializer.is_valid()
+
+    assert not ConsultantValidationSerializer({'nationality': 'Kenya'}).errors
@@ -163,3 +163,29 @@ def test_log_entry_api_returns_filtered_entries(client, staff_user):
     assert result["id"] == entry_one.pk
     assert result["context"]["action"] == "test.action"
     assert result["user"]["id"] == staff_user.id
+
+
+@pytest.mark.django_db
+def test_log_entry_serializer_prepare_queryset_joins_users(
+    staff_user, consultant_user, django_assert_num_queries
+):
+    from consultant_app.serializers import LogEntrySerializer
+
+    for user in (staff_user, consultant_user, staff_user):
+        LogEntry.objects.create(
+            logger_name="apps.consultants.views",
+            level="INFO",
+            message="Entry",
+            user=user,
+        )
+
+    with django_assert_num_queries(1):
+        payloads = [
+            LogEntrySerializer(entry).data
+            for entry in LogEntrySerializer.prepare_queryset(LogEntry.objects.all())
+        ]
+
+    assert {payload["user"]["username"] for payload in payloads} == {
+        "staff_user",
+        "consultant_user",
+    }
@@ -7,6 +7,7 @@ from apps.consultants.models import Consultant, LogEntry
 from consultant_app.models import Certificate
 from consultant_app.tasks.notifications import (
     NotificationDeliveryError,
+    _compile_template,
     send_certificate_notification,
 )
 
@@ -146,3 +147,275 @@ def test_send_certificate_notification_raises_on_email_failure(
         context__status="failed",
     ).first()
     assert failure_entry is not None
+
+
+@pytest.mark.django_db
+def test_batched_notification_logs_insert_on_exit(consultant_certificate):
+    from consultant_app.signals import (
+        batched_notification_logs,
+        certificate_notification_dispatched,
+    )
+
+    consultant, certificate = consultant_certificate
+    LogEntry.objects.all().delete()
+
+    with batched_notification_logs():
+        for channel in ("email", "sms"):
+            certificate_notification_dispatched.send(
+                sender=None,
+                consultant_id=consultant.pk,
+                event="issued",
+                channel=channel,
+                status="sent",
+                certificate_id=certificate.pk,
+            )
+        assert not LogEntry.objects.exists()
+
+    channels = set(
+        LogEntry.objects.filter(
+            context__action="certificate.notification.issued"
+        ).values_list("context__channel", flat=True)
+    )
+    assert channels == {"email", "sms"}
+
+
+@pytest.mark.django_db
+def test_batched_notification_logs_use_raw_insert_for_large_batches(
+    consultant_certificate, monkeypatch
+):
+    from consultant_app import signals
+
+    consultant, certificate = consultant_certificate
+    LogEntry.objects.all().delete()
+    monkeypatch.setattr(signals, "_RAW_INSERT_THRESHOLD", 1)
+
+    with signals.batched_notification_logs():
+        for status in ("sent", "failed"):
+            signals.certificate_notification_dispatched.send(
+                sender=None,
+                consultant_id=consultant.pk,
+                event="issued",
+                channel="email",
+                status=status,
+                certificate_id=certificate.pk,
+                metadata={"attempt": 1},
+            )
+
+    entries = list(LogEntry.objects.order_by("level"))
+    assert [entry.level for entry in entries] == ["INFO", "WARNING"]
+    assert all(entry.timestamp is not None for entry in entries)
+    assert entries[0].context["metadata"] == {"attempt": 1}
+    assert entries[1].context["status"] == "failed"
+
+
+@pytest.mark.django_db
+def test_send_certificate_notification_honours_template_overrides(
+    settings, consultant_certificate
+):
+    consultant, certificate = consultant_certificate
+    mail.outbox.clear()
+    kwargs = {"event": "issued", "certificate_id": certificate.pk, "send_sms": False}
+
+    send_certificate_notification.apply(args=(consultant.pk,), kwargs=kwargs).get()
+    assert mail.outbox[-1].subject == "Your consultant certificate has been issued"
+
+    settings.CERTIFICATE_NOTIFICATION_TEMPLATES = {
+        "issued": {"email_subject": "Certificate {certificate_reference} issued"}
+    }
+    send_certificate_notification.apply(args=(consultant.pk,), kwargs=kwargs).get()
+    assert mail.outbox[-1].subject == f"Certificate #{certificate.pk} issued"
+
+
+def test_compile_template_matches_safe_format_map():
+    render = _compile_template("Hi {name}, {{literal}} {missing}!")
+    assert render({"name": "Ada"}) == "Hi Ada, {literal} !"
+    assert _compile_template("Hi {name}, {{literal}} {missing}!") is render
+
+    padded = _compile_template("[{name:>5}] {missing}")
+    assert padded({"name": "Ada"}) == "[  Ada] "
+
+
+def test_sms_requests_share_the_connection_pool(settings, mocker):
+    from types import SimpleNamespace
+
+    from consultant_app.tasks import notifications
+
+    settings.CERTIFICATE_SMS_GATEWAY_TOKEN = "gateway-token"
+    request = mocker.patch.object(
+        notifications._HTTP, "request", return_value=SimpleNamespace(status=201)
+    )
+
+    notifications._twilio_request("AC123", "secret", "+100", "+200", "Hello")
+    notifications._gateway_request("https://sms.example.com/send", "+200", "Hello")
+
+    twilio_call, gateway_call = request.call_args_list
+    assert twilio_call.args == (
+        "POST",
+        "https://api.twilio.com/2010-04-01/Accounts/AC123/Messages.json",
+    )
+    assert twilio_call.kwargs["headers"]["Authorization"].startswith("Basic ")
+    assert gateway_call.kwargs["headers"]["Authorization"] == "Bearer gateway-token"
+
+    request.return_value = SimpleNamespace(status=503)
+    with pytest.raises(notifications.urllib3.exceptions.HTTPError):
+        notifications._gateway_request("https://sms.example.com/send", "+200", "Hi")
+
+
+@pytest.mark.django_db
+def test_bulk_notifications_share_one_mail_connection(
+    settings, mocker, consultant_certificate
+):
+    from consultant_app.tasks import notifications
+
+    consultant, certificate = consultant_certificate
+    mail.outbox.clear()
+    settings.CERTIFICATE_NOTIFICATION_ENABLE_SMS = False
+    deliver = mocker.spy(notifications, "_deliver_certificate_notification")
+
+    results = notifications.send_certificate_notifications_bulk.apply(
+        args=(
+            [
+                {"consultant_id": consultant.pk, "event": "issued"},
+                {
+                    "consultant_id": consultant.pk,
+                    "event": "revoked",
+                    "certificate_id": certificate.pk,
+                },
+            ],
+        ),
+    ).get()
+
+    assert [result["email"] for result in results] == ["sent", "sent"]
+    assert len(mail.outbox) == 2
+    connections = {call.kwargs["connection"] for call in deliver.call_args_list}
+    assert len(connections) == 1
+
+
+def test_dispatch_certificate_notifications_chunks_items(mocker):
+    from consultant_app.tasks import notifications
+
+    delay = mocker.patch.object(
+        notifications.send_certificate_notifications_bulk, "delay"
+    )
+    items = [{"consultant_id": pk, "event": "revoked"} for pk in range(5)]
+
+    assert notifications.dispatch_certificate_notifications(items, chunk_size=2) == 3
+    assert [len(call.args[0]) for call in delay.call_args_list] == [2, 2, 1]
+
+
+@pytest.mark.django_db
+def test_bulk_notifications_send_sms_from_a_thread_pool(
+    settings, mocker, consultant_certificate
+):
+    import threading
+
+    from consultant_app.tasks import notifications
+
+    consultant, certificate = consultant_certificate
+    LogEntry.objects.all().delete()
+    settings.CERTIFICATE_NOTIFICATION_ENABLE_SMS = True
+    sms_threads = []
+
+    def fake_dispatch(phone_number, message):
+        sms_threads.append(threading.get_ident())
+        if "revoked" in message:
+            raise RuntimeError("gateway down")
+        return True
+
+    mocker.patch.object(notifications, "_dispatch_sms", side_effect=fake_dispatch)
+
+    results = notifications.send_certificate_notifications_bulk.apply(
+        args=(
+            [
+                {"consultant_id": consultant.pk, "event": "issued"},
+                {"consultant_id": consultant.pk, "event": "revoked"},
+            ],
+        ),
+    ).get()
+
+    assert [result["sms"] for result in results] == ["sent", "failed"]
+    assert threading.get_ident() not in sms_threads
+    statuses = set(
+        LogEntry.objects.filter(context__channel="sms").values_list(
+            "context__status", flat=True
+        )
+    )
+    assert statuses == {"sent", "failed"}
+
+
+@pytest.mark.django_db
+def test_notification_loads_consultant_with_its_certificate(consultant_certificate):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    consultant, certificate = consultant_certificate
+
+    with CaptureQueriesContext(connection) as queries:
+        result = send_certificate_notification.apply(
+            args=(consultant.pk,),
+            kwargs={
+                "event": "revoked",
+                "certificate_id": certificate.pk,
+                "send_sms": False,
+            },
+        ).get()
+
+    assert result["email"] == "sent"
+    selects = [
+        query["sql"]
+        for query in queries
+        if query["sql"].lstrip().upper().startswith("SELECT")
+    ]
+    assert len(selects) == 1
+
+
+def test_sms_default_follows_setting_overrides(settings):
+    from consultant_app.tasks.notifications import _should_send_sms
+
+    settings.CERTIFICATE_NOTIFICATION_ENABLE_SMS = True
+    assert _should_send_sms(None) is True
+
+    settings.CERTIFICATE_NOTIFICATION_ENABLE_SMS = False
+    assert _should_send_sms(None) is False
+    assert _should_send_sms(True) is True
+
+
+@pytest.mark.django_db
+def test_verification_url_is_only_built_when_a_template_uses_it(
+    mocker, consultant_certificate
+):
+    consultant, certificate = consultant_certificate
+    build_url = mocker.patch(
+        "consultant_app.tasks.notifications.build_verification_url",
+        return_value="https://example.com/verify",
+    )
+    kwargs = {"event": "issued", "certificate_id": certificate.pk}
+
+    consultant.email = ""
+    consultant.save(update_fields=["email"])
+    send_certificate_notification.apply(
+        args=(consultant.pk,), kwargs={**kwargs, "send_sms": True}
+    ).get()
+    build_url.assert_not_called()
+
+    consultant.email = "notify@example.com"
+    consultant.save(update_fields=["email"])
+    mail.outbox.clear()
+    send_certificate_notification.apply(
+        args=(consultant.pk,), kwargs={**kwargs, "send_sms": False}
+    ).get()
+    build_url.assert_called_once()
+    assert "https://example.com/verify" in mail.outbox[-1].body
+
+
+def test_format_datetime_uses_the_active_timezone():
+    from datetime import datetime, timezone as dt_timezone
+
+    from consultant_app.tasks.notifications import _format_datetime
+
+    value = datetime(2025, 3, 4, 23, 30, tzinfo=dt_timezone.utc)
+    with timezone.override("UTC"):
+        assert _format_datetime(value) == "04 March 2025"
+    with timezone.override("Africa/Nairobi"):
+        assert _format_datetime(value) == "05 March 2025"
+    assert _format_datetime(None) == ""
@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 from django.contrib.auth import get_user_model
 from django.core import mail
+from django.core.cache import cache
 from django.test import override_settings
 from django.utils import timezone
 
@@ -12,6 +13,11 @@ from consultant_app.tasks.scheduled_reports import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
 @pytest.fixture
 def consultant_factory(db):
     from apps.consultants.models import Consultant
@@ -88,3 +94,60 @@ def test_celery_schedule_registers_report_tasks():
     schedule = getattr(settings, "CELERY_BEAT_SCHEDULE", {})
     assert "consultant_app.send_weekly_admin_report" in schedule
     assert "consultant_app.send_monthly_admin_report" in schedule
+
+
+@pytest.mark.django_db
+@override_settings(ADMIN_REPORT_RECIPIENTS=())
+def test_admin_recipients_are_cached_until_membership_changes(
+    django_assert_num_queries,
+):
+    from django.contrib.auth.models import Group
+
+    from apps.users.constants import UserRole, groups_for_roles
+    from consultant_app.tasks.scheduled_reports import _resolve_recipients
+
+    user_model = get_user_model()
+    user_model.objects.create_superuser(
+        username="report-root", email="root@example.com", password="pass1234"
+    )
+    board_member = user_model.objects.create_user(
+        username="report-board", email="board@example.com", password="pass1234"
+    )
+
+    assert _resolve_recipients() == ["root@example.com"]
+    with django_assert_num_queries(0):
+        assert _resolve_recipients() == ["root@example.com"]
+
+    board_member.last_login = timezone.now()
+    board_member.save(update_fields=["last_login"])
+    with django_assert_num_queries(0):
+        assert _resolve_recipients() == ["root@example.com"]
+
+    group, _ = Group.objects.get_or_create(
+        name=sorted(groups_for_roles([UserRole.BOARD]))[0]
+    )
+    board_member.groups.add(group)
+
+    assert _resolve_recipients() == ["board@example.com", "root@example.com"]
+
+
+@pytest.mark.django_db
+@override_settings(ADMIN_REPORT_RECIPIENTS=("admin@example.com",))
+def test_back_to_back_reports_reuse_the_rendered_payload(consultant_factory, mocker):
+    from consultant_app.tasks import scheduled_reports
+
+    consultant_factory(status="approved")
+    render = mocker.spy(scheduled_reports, "render_dashboard_pdf")
+
+    first = send_admin_report("manual")
+    second = send_weekly_admin_report()
+    assert render.call_count == 1
+    assert second["generated_at"] == first["generated_at"]
+
+    consultant_factory(status="submitted")
+    send_admin_report("manual")
+    assert render.call_count == 1
+
+    cache.clear()
+    send_admin_report("manual")
+    assert render.call_count == 2
@@ -5,11 +5,10 @@ from __future__ import annotations
 import csv
 import io
 from collections import Counter
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, Iterable, List, Sequence
 
 from django.utils import timezone
 from django.template.loader import render_to_string
-from weasyprint import HTML
 
 from apps.consultants.models import Consultant as BaseConsultant
 from consultant_app.models import Certificate, Consultant
@@ -63,7 +62,7 @@ def _latest_certificate(consultant: Consultant) -> Certificate | None:
     return Certificate.objects.latest_for_consultant(consultant)
 
 
-def prepare_dashboard_rows(consultants: Sequence[Consultant]) -> List[Dict[str, Any]]:
+def prepare_dashboard_rows(consultants: Iterable[Consultant]) -> List[Dict[str, Any]]:
     rows: List[Dict[str, Any]] = []
     for consultant in consultants:
         serializer = ConsultantDashboardSerializer(consultant)
@@ -201,6 +200,8 @@ def render_dashboard_pdf(
             "generated_at": generated_at,
         },
     )
+    from weasyprint import HTML
+
     return HTML(string=html, base_url=base_url).write_pdf()
 
 
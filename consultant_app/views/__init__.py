@@ -228,7 +228,12 @@ def search_certificate(request):
 def verify_certificate(request, certificate_uuid: UUID):
     """Render a public verification page for consultant certificates."""
 
-    consultant = get_object_or_404(Consultant, certificate_uuid=certificate_uuid)
+    # Prefetching the certificate history lets the latest-record and token
+    # matching lookups below share one query instead of issuing three.
+    consultant = get_object_or_404(
+        Consultant.objects.prefetch_related("certificate_records"),
+        certificate_uuid=certificate_uuid,
+    )
 
     token = request.GET.get("token", "")
     verification_error = None
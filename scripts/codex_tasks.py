@@ -14,7 +14,7 @@ import sys
 from datetime import datetime
 from importlib.util import find_spec
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 PRIMARY_TASK_FILE = REPO_ROOT / "codex_tasks.yml"
@@ -59,44 +59,18 @@ def task_file() -> Path:
     return PRIMARY_TASK_FILE
 
 
-def create_task(args: Dict[str, str]) -> None:
-    """Create a new Codex task entry and append it to ``codex_tasks.yml``."""
-    task_path = task_file()
-    if not task_path.exists():
-        task_path.write_text("tasks:\n", encoding="utf-8")
-
-    name = args.get("--name")
-    desc = args.get("--description", "")
-    goal = args.get("--goal", "")
-    criteria = args.get("--acceptance-criteria", "")
-    component = args.get("--component", "")
-    task_type = args.get("--type", "review")
-    fix = args.get("--fix", "manual")
-
-    if not name:
-        log("❗Missing required parameter: --name")
-        sys.exit(1)
-
-    with task_path.open("a", encoding="utf-8") as handle:
-        handle.write(
-            f"""
-  {name}:
-    description: "{desc}"
-    command: |
-      codex custom "You are GPT-5 Codex. Task type: {task_type}.
-      Goal: {goal}.
-      Acceptance criteria: {criteria}.
-      Component: {component}.
-      Fix strategy: {fix}.
-      Perform the requested review or fix and output result."
-"""
-        )
-
-    log(f"✅ Task '{name}' created and saved to {task_path}.")
+_TASK_COMMAND_TEMPLATE = (
+    'codex custom "You are GPT-5 Codex. Task type: {task_type}.\n'
+    "Goal: {goal}.\n"
+    "Acceptance criteria: {criteria}.\n"
+    "Component: {component}.\n"
+    "Fix strategy: {fix}.\n"
+    'Perform the requested review or fix and output result."\n'
+)
 
 
-def load_tasks() -> Dict[str, Dict[str, str]]:
-    """Return the task mapping from ``codex_tasks.yml``."""
+def _import_yaml():
+    """Return the ``yaml`` module or exit with an installation hint."""
     if find_spec("yaml") is None:
         log(
             "❗ Missing dependency: PyYAML is required. Install with "
@@ -106,6 +80,75 @@ def load_tasks() -> Dict[str, Dict[str, str]]:
 
     import yaml
 
+    return yaml
+
+
+def create_tasks(entries: List[Dict[str, str]]) -> None:
+    """Add one or more Codex task entries to ``codex_tasks.yml`` in a single write."""
+    yaml = _import_yaml()
+
+    new_tasks: Dict[str, Dict[str, str]] = {}
+    for args in entries:
+        name = args.get("--name")
+        if not name:
+            log("❗Missing required parameter: --name")
+            sys.exit(1)
+
+        new_tasks[name] = {
+            "description": args.get("--description", ""),
+            "command": _TASK_COMMAND_TEMPLATE.format(
+                task_type=args.get("--type", "review"),
+                goal=args.get("--goal", ""),
+                criteria=args.get("--acceptance-criteria", ""),
+                component=args.get("--component", ""),
+                fix=args.get("--fix", "manual"),
+            ),
+        }
+
+    class _TaskDumper(yaml.SafeDumper):
+        pass
+
+    def _represent_str(dumper, value):
+        style = "|" if "\n" in value else None
+        return dumper.represent_scalar("tag:yaml.org,2002:str", value, style=style)
+
+    _TaskDumper.add_representer(str, _represent_str)
+
+    # Dump only the new entries and append them under the existing ``tasks:``
+    # key; re-dumping the whole catalogue would drop its comments and layout.
+    dumped = yaml.dump(
+        {"tasks": new_tasks},
+        Dumper=_TaskDumper,
+        sort_keys=False,
+        allow_unicode=True,
+    )
+    body = dumped.split("\n", 1)[1]
+
+    task_path = task_file()
+    existing = task_path.read_text(encoding="utf-8") if task_path.exists() else ""
+    if not existing:
+        prefix = "tasks:\n"
+    elif existing.endswith("\n"):
+        prefix = "\n"
+    else:
+        prefix = "\n\n"
+
+    with task_path.open("a", encoding="utf-8") as handle:
+        handle.write(prefix + body)
+
+    for name in new_tasks:
+        log(f"✅ Task '{name}' created and saved to {task_path}.")
+
+
+def create_task(args: Dict[str, str]) -> None:
+    """Create a new Codex task entry and save it to ``codex_tasks.yml``."""
+    create_tasks([args])
+
+
+def load_tasks() -> Dict[str, Dict[str, str]]:
+    """Return the task mapping from ``codex_tasks.yml``."""
+    yaml = _import_yaml()
+
     path = task_file()
 
     if not path.exists():
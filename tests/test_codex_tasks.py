@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+
+def load_codex_tasks_module():
+    repo_root = Path(__file__).resolve().parent.parent
+    spec = importlib.util.spec_from_file_location(
+        "codex_tasks_script", repo_root / "scripts" / "codex_tasks.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    assert spec and spec.loader  # for type checkers
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+codex_tasks = load_codex_tasks_module()
+
+
+@pytest.fixture
+def task_catalogue(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "codex_tasks.yml"
+    path.write_text(
+        "version: 1\n"
+        "tasks:\n"
+        "\n"
+        "  # 🔧 CI and Test Suite Group\n"
+        "  setup-ci:\n"
+        '    description: "Create GitHub Actions pipeline."\n'
+        "    command: |\n"
+        '      codex custom "Add a workflow."\n',
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(codex_tasks, "PRIMARY_TASK_FILE", path)
+    return path
+
+
+def test_create_tasks_preserves_existing_catalogue(task_catalogue: Path):
+    original = task_catalogue.read_text(encoding="utf-8")
+
+    codex_tasks.create_tasks(
+        [
+            {"--name": "demo", "--description": "Example task", "--goal": "Ship it"},
+            {"--name": "second", "--description": "Another task"},
+        ]
+    )
+
+    updated = task_catalogue.read_text(encoding="utf-8")
+    assert updated.startswith(original)
+    assert "# 🔧 CI and Test Suite Group" in updated
+
+    tasks = yaml.safe_load(updated)["tasks"]
+    assert list(tasks) == ["setup-ci", "demo", "second"]
+    assert tasks["demo"]["description"] == "Example task"
+    assert "Goal: Ship it." in tasks["demo"]["command"]
@@ -5,13 +5,12 @@ from typing import Final
 
 import qrcode
 from PIL import Image
+from qrcode.image.svg import SvgPathImage
 
 _DEFAULT_ERROR_CORRECTION: Final = qrcode.constants.ERROR_CORRECT_M
 
 
-def generate_qr_code(data: str, *, box_size: int = 10, border: int = 4) -> Image.Image:
-    """Return a QR code image encoding the provided data string."""
-
+def _build_qr(data: str, *, box_size: int, border: int) -> qrcode.QRCode:
     if not isinstance(data, str) or not data:
         raise ValueError("QR code data must be a non-empty string.")
 
@@ -23,7 +22,13 @@ def generate_qr_code(data: str, *, box_size: int = 10, border: int = 4) -> Image
     )
     qr.add_data(data)
     qr.make(fit=True)
+    return qr
 
+
+def generate_qr_code(data: str, *, box_size: int = 10, border: int = 4) -> Image.Image:
+    """Return a QR code image encoding the provided data string."""
+
+    qr = _build_qr(data, box_size=box_size, border=border)
     image = qr.make_image(fill_color="black", back_color="white")
     if not isinstance(image, Image.Image):
         image = image.convert("RGB")
@@ -31,4 +36,18 @@ def generate_qr_code(data: str, *, box_size: int = 10, border: int = 4) -> Image
     return image.convert("RGB")
 
 
-__all__ = ["generate_qr_code"]
+def generate_qr_svg(data: str, *, box_size: int = 10, border: int = 4) -> str:
+    """Return an inline ``<svg>`` element for a QR code encoding ``data``.
+
+    Vector output skips rasterising and PNG-compressing the code entirely.
+    """
+
+    qr = _build_qr(data, box_size=box_size, border=border)
+    image = qr.make_image(image_factory=SvgPathImage)
+    return image.to_string(encoding="unicode")
+
+
+__all__ = [
+    "generate_qr_code",
+    "generate_qr_svg",
+]